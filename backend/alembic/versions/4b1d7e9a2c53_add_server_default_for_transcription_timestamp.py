@@ -0,0 +1,31 @@
+"""Add server default for transcription timestamp
+
+Revision ID: 4b1d7e9a2c53
+Revises: c9c139249b48
+Create Date: 2026-10-15 10:12:41.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d7e9a2c53'
+down_revision: Union[str, None] = 'c9c139249b48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Let the database assign transcription timestamps on insert
+    op.alter_column('transcriptions', 'timestamp',
+                    existing_type=sa.DateTime(),
+                    server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    op.alter_column('transcriptions', 'timestamp',
+                    existing_type=sa.DateTime(),
+                    server_default=None)
@@ -0,0 +1,26 @@
+"""Add transcription (meeting_id, timestamp, id) index
+
+Revision ID: 7e3a9c1d5f28
+Revises: 4b1d7e9a2c53
+Create Date: 2026-10-15 23:31:07.524119
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3a9c1d5f28'
+down_revision: Union[str, None] = '4b1d7e9a2c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_transcription_meeting_ts', 'transcriptions', ['meeting_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transcription_meeting_ts', table_name='transcriptions')
@@ -42,10 +42,35 @@ class AudioChunker:
         self.silence_threshold = silence_threshold
         self.silence_duration = silence_duration
         self.min_chunk_duration = min_chunk_duration
-        self.buffer = np.array([], dtype=np.float32)
+        # Pending samples live in a preallocated array as _storage[_start:_end], so
+        # appending a received packet is a slice copy rather than a reallocation
+        self._storage = np.empty(max(1, int(sample_rate * chunk_duration)) * 2, dtype=np.float32)
+        self._start = 0
+        self._end = 0
         self.temp_dir = tempfile.mkdtemp()
         self.processed_chunk_yield_count = 0 # Counter for chunks yielded
         
+    @property
+    def buffer(self) -> np.ndarray:
+        """View of the samples waiting to be chunked."""
+        return self._storage[self._start:self._end]
+    
+    def _append_to_buffer(self, audio_chunk: np.ndarray) -> None:
+        """Append samples, compacting or growing the storage only when it is full."""
+        n = len(audio_chunk)
+        if self._end + n > len(self._storage):
+            pending = self._end - self._start
+            if pending + n > len(self._storage):
+                storage = np.empty(max(len(self._storage) * 2, pending + n), dtype=np.float32)
+                storage[:pending] = self._storage[self._start:self._end]
+                self._storage = storage
+            else:
+                self._storage[:pending] = self._storage[self._start:self._end]
+            self._start = 0
+            self._end = pending
+        self._storage[self._end:self._end + n] = audio_chunk
+        self._end += n
+    
     def get_queued_chunk_count(self) -> int:
         """Get the number of full chunks currently in the buffer."""
         if self.sample_rate * self.chunk_duration == 0:
@@ -83,42 +108,45 @@ class AudioChunker:
             sf.write(chunk_file, audio_data, self.sample_rate)
             return chunk_file
     
+    def feed(self, audio_chunk: np.ndarray) -> Generator[Tuple[np.ndarray, float, float], None, None]:
+        """Append one received packet and yield every full, non-silent chunk it completes."""
+        if settings.SHOW_BACKEND_LOGS:
+            print(f"[AudioChunker] Buffer size before append: {self._end - self._start}")
+        self._append_to_buffer(audio_chunk)
+        if settings.SHOW_BACKEND_LOGS:
+            print(f"[AudioChunker] Buffer size after append: {self._end - self._start}")
+        
+        # Process buffer while it's long enough
+        while self._end - self._start >= self.sample_rate * self.chunk_duration:
+            chunk_size = int(self.sample_rate * self.chunk_duration)
+            # Copy out: the storage is reused by later appends
+            current_chunk = self._storage[self._start:self._start + chunk_size].copy()
+            self._start += chunk_size
+            buffer_size_after_trim = self._end - self._start
+            if settings.SHOW_BACKEND_LOGS:
+                print(f"[AudioChunker] Trimmed buffer. Size after trim: {buffer_size_after_trim}")
+            
+            # Calculate timestamps
+            start_time = buffer_size_after_trim / self.sample_rate
+            end_time = start_time + len(current_chunk) / self.sample_rate
+            if settings.SHOW_BACKEND_LOGS:
+                print(f"[AudioChunker] Yielding chunk: start={start_time:.2f}s, end={end_time:.2f}s, chunk_size={len(current_chunk)}")
+            
+            # Check for silence
+            if self.is_silence(current_chunk):
+                if settings.SHOW_BACKEND_LOGS:
+                    print(f"[AudioChunker] Chunk is silence. Skipping.")
+                continue
+                
+            self.processed_chunk_yield_count += 1 # Increment count before yielding
+            yield current_chunk, start_time, end_time
+    
     async def process_audio_stream(self, audio_chunks: List[np.ndarray]) -> AsyncGenerator[Tuple[np.ndarray, float, float], None]:
         """Process audio stream and yield chunks based on silence and duration."""
         try:
             for chunk in audio_chunks:
-                # Add chunk to buffer
-                buffer_size_before = len(self.buffer)
-                if settings.SHOW_BACKEND_LOGS:
-                    print(f"[AudioChunker] Buffer size before append: {buffer_size_before}")
-                self.buffer = np.append(self.buffer, chunk)
-                buffer_size_after_append = len(self.buffer)
-                if settings.SHOW_BACKEND_LOGS:
-                    print(f"[AudioChunker] Buffer size after append: {buffer_size_after_append}")
-                
-                # Process buffer while it's long enough
-                while len(self.buffer) >= self.sample_rate * self.chunk_duration:
-                    chunk_size = int(self.sample_rate * self.chunk_duration)
-                    current_chunk = self.buffer[:chunk_size]
-                    self.buffer = self.buffer[chunk_size:]
-                    buffer_size_after_trim = len(self.buffer)
-                    if settings.SHOW_BACKEND_LOGS:
-                        print(f"[AudioChunker] Trimmed buffer. Size after trim: {buffer_size_after_trim}")
-                    
-                    # Calculate timestamps
-                    start_time = buffer_size_after_trim / self.sample_rate
-                    end_time = start_time + len(current_chunk) / self.sample_rate
-                    if settings.SHOW_BACKEND_LOGS:
-                        print(f"[AudioChunker] Yielding chunk: start={start_time:.2f}s, end={end_time:.2f}s, chunk_size={len(current_chunk)}")
-                    
-                    # Check for silence
-                    if self.is_silence(current_chunk):
-                        if settings.SHOW_BACKEND_LOGS:
-                            print(f"[AudioChunker] Chunk is silence. Skipping.")
-                        continue
-                        
-                    self.processed_chunk_yield_count += 1 # Increment count before yielding
-                    yield current_chunk, start_time, end_time
+                for processed in self.feed(chunk):
+                    yield processed
         except Exception as e:
             
             print(f"[AudioChunker] Error processing audio stream: {str(e)}")
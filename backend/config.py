@@ -113,6 +113,13 @@ class Settings(BaseSettings):
     # Railway-specific optimizations
     RAILWAY_MEMORY_LIMIT_MB: int = Field(default=8192, description="Railway memory limit")
     ENABLE_MEMORY_MONITORING: bool = Field(default=True, description="Monitor memory usage")
+
+    # Redis cache for LLM responses (optional, shared across workers)
+    REDIS_URL: Optional[str] = Field(
+        default=None,
+        description="Redis connection URL; run Redis with maxmemory-policy volatile-lru to bound the cache"
+    )
+    LLM_CACHE_TTL_SECONDS: int = Field(default=86400, description="TTL for cached LLM summaries and action items")
     
     @validator('SECRET_KEY')
     def validate_secret_key(cls, v):
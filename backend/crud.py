@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, bindparam, exists
 from datetime import datetime, timedelta
 from typing import Optional, List
 import jwt
@@ -15,6 +16,39 @@ import os
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Statements for the hot per-meeting reads, built once at import with bound
+# parameters: no per-call Query construction, and every call reuses the same
+# compiled-cache entry
+_OWNED_MEETING_STMT = select(models.Meeting).where(
+    models.Meeting.id == bindparam("meeting_id"),
+    models.Meeting.owner_id == bindparam("user_id")
+).limit(1)
+# Ownership check only: the server returns a single boolean, no meeting row
+_OWNED_MEETING_EXISTS_STMT = select(exists().where(
+    models.Meeting.id == bindparam("meeting_id"),
+    models.Meeting.owner_id == bindparam("user_id")
+))
+_MEETING_SUMMARIES_STMT = select(models.Summary).where(
+    models.Summary.meeting_id == bindparam("meeting_id")
+).order_by(models.Summary.generated_at.desc())
+_MEETING_NOTES_STMT = select(models.MeetingNotes).where(
+    models.MeetingNotes.meeting_id == bindparam("meeting_id")
+).order_by(models.MeetingNotes.generated_at.desc())
+# Owned meeting plus the content of its latest summary and notes in one SELECT;
+# correlated LIMIT 1 subqueries work on PostgreSQL, SQLite and MySQL alike
+_MEETING_WITH_LATEST_STMT = select(
+    models.Meeting,
+    select(models.Summary.content).where(
+        models.Summary.meeting_id == models.Meeting.id
+    ).order_by(models.Summary.generated_at.desc()).limit(1).correlate(models.Meeting).scalar_subquery(),
+    select(models.MeetingNotes.content).where(
+        models.MeetingNotes.meeting_id == models.Meeting.id
+    ).order_by(models.MeetingNotes.generated_at.desc()).limit(1).correlate(models.Meeting).scalar_subquery()
+).where(
+    models.Meeting.id == bindparam("meeting_id"),
+    models.Meeting.owner_id == bindparam("user_id")
+)
+
 # User operations
 def get_user(db: Session, user_id: int):
     return db.query(models.User).filter(models.User.id == user_id).first()
@@ -275,27 +309,35 @@ def create_summary(db: Session, summary: schemas.SummaryCreate):
     return db_summary
 
 def get_meeting_summaries(db: Session, meeting_id: int):
-    return db.query(models.Summary).filter(
-        models.Summary.meeting_id == meeting_id
-    ).order_by(models.Summary.generated_at.desc()).all()
+    return db.execute(_MEETING_SUMMARIES_STMT, {"meeting_id": meeting_id}).scalars().all()
 
 def get_latest_meeting_summary(db: Session, meeting_id: int):
     return db.query(models.Summary).filter(
         models.Summary.meeting_id == meeting_id
     ).order_by(models.Summary.generated_at.desc()).first()
 
+# Shared OpenAI client: built on first use and reused, so calls share one
+# connection pool instead of opening a new one (and TLS session) each time
+_openai_client = None
+
+def get_openai_client() -> OpenAI:
+    global _openai_client
+    if _openai_client is None:
+        # Initialize OpenAI client with defensive approach
+        try:
+            _openai_client = OpenAI(
+                api_key=config.settings.OPENAI_API_KEY,
+                timeout=60.0,  # Explicit timeout
+                max_retries=2   # Explicit retry count
+            )
+        except TypeError:
+            # Fallback for older OpenAI library versions
+            _openai_client = OpenAI(api_key=config.settings.OPENAI_API_KEY)
+    return _openai_client
+
 # Transcription operations
 async def process_audio(db: Session, meeting_id: int, audio_data: schemas.AudioData):
-    # Initialize OpenAI client with defensive approach
-    try:
-        client = OpenAI(
-            api_key=config.settings.OPENAI_API_KEY,
-            timeout=60.0,  # Explicit timeout
-            max_retries=2   # Explicit retry count
-        )
-    except TypeError:
-        # Fallback for older OpenAI library versions
-        client = OpenAI(api_key=config.settings.OPENAI_API_KEY)
+    client = get_openai_client()
     
     temp_file_path = None
     
@@ -351,16 +393,7 @@ async def process_audio(db: Session, meeting_id: int, audio_data: schemas.AudioD
 
 async def generate_action_items(text: str) -> list:
     try:
-        # Initialize OpenAI client with defensive approach
-        try:
-            client = OpenAI(
-                api_key=config.settings.OPENAI_API_KEY,
-                timeout=60.0,  # Explicit timeout
-                max_retries=2   # Explicit retry count
-            )
-        except TypeError:
-            # Fallback for older OpenAI library versions
-            client = OpenAI(api_key=config.settings.OPENAI_API_KEY)
+        client = get_openai_client()
         
         response = client.chat.completions.create(
             model="gpt-3.5-turbo",
@@ -387,9 +420,7 @@ def create_meeting_notes(db: Session, meeting_notes: schemas.MeetingNotesCreate)
     return db_meeting_notes
 
 def get_meeting_notes(db: Session, meeting_id: int):
-    return db.query(models.MeetingNotes).filter(
-        models.MeetingNotes.meeting_id == meeting_id
-    ).order_by(models.MeetingNotes.generated_at.desc()).all()
+    return db.execute(_MEETING_NOTES_STMT, {"meeting_id": meeting_id}).scalars().all()
 
 def get_latest_meeting_notes(db: Session, meeting_id: int):
     return db.query(models.MeetingNotes).filter(
@@ -397,12 +428,21 @@ def get_latest_meeting_notes(db: Session, meeting_id: int):
     ).order_by(models.MeetingNotes.generated_at.desc()).first()
 
 # Meeting status operations
+def get_owned_meeting(db: Session, meeting_id: int, user_id: int) -> Optional[models.Meeting]:
+    """Get a meeting only if it belongs to the given user"""
+    return db.execute(_OWNED_MEETING_STMT, {"meeting_id": meeting_id, "user_id": user_id}).scalars().first()
+
+def owns_meeting(db: Session, meeting_id: int, user_id: int) -> bool:
+    """Check that a meeting exists and belongs to the given user"""
+    return db.execute(_OWNED_MEETING_EXISTS_STMT, {"meeting_id": meeting_id, "user_id": user_id}).scalar()
+
+def get_meeting_with_latest_summary_and_notes(db: Session, meeting_id: int, user_id: int):
+    """Get (meeting, latest summary content, latest notes content) in one round trip, or None if not owned"""
+    return db.execute(_MEETING_WITH_LATEST_STMT, {"meeting_id": meeting_id, "user_id": user_id}).first()
+
 def mark_meeting_as_ended(db: Session, meeting_id: int, user_id: int):
     """Mark a meeting as ended and set the end time"""
-    db_meeting = db.query(models.Meeting).filter(
-        models.Meeting.id == meeting_id,
-        models.Meeting.owner_id == user_id
-    ).first()
+    db_meeting = get_owned_meeting(db, meeting_id, user_id)
     
     if not db_meeting:
         return None
@@ -418,10 +458,7 @@ def mark_meeting_as_ended(db: Session, meeting_id: int, user_id: int):
 
 def get_meeting_status(db: Session, meeting_id: int, user_id: int):
     """Get the current status of a meeting"""
-    db_meeting = db.query(models.Meeting).filter(
-        models.Meeting.id == meeting_id,
-        models.Meeting.owner_id == user_id
-    ).first()
+    db_meeting = get_owned_meeting(db, meeting_id, user_id)
     
     if not db_meeting:
         return None
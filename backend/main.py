@@ -7,28 +7,39 @@ warnings.filterwarnings("ignore", message="torchaudio._backend.get_audio_backend
 warnings.filterwarnings("ignore", message="`torchaudio.backend.common.AudioMetaData` has been moved")
 warnings.filterwarnings("ignore", message="Module 'speechbrain.pretrained' was deprecated")
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 import os
 import sys
 import time
 import asyncio
 import json
 import base64
+import gc
+import traceback
 import tempfile
 import shutil
 import subprocess
 import uuid
 import hashlib
+import functools
 import secrets
 import concurrent.futures
+import threading
+import multiprocessing
 import glob
 import mimetypes
+import mmap
+import wave
+from collections import Counter
+from operator import attrgetter
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple
 from pathlib import Path
+from contextlib import asynccontextmanager
 import re
 from urllib.parse import quote
-import psutil
-import gc
 
 # Suppress passlib bcrypt warning due to bcrypt 4.1+ compatibility issue
 # See: https://github.com/pyca/bcrypt/issues/684
@@ -38,13 +49,13 @@ from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, F
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse, FileResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, FileResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func, text, or_, and_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, asc, func, text, or_, and_, bindparam
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 import uvicorn
@@ -55,7 +66,8 @@ from slowapi.middleware import SlowAPIMiddleware
 import redis
 from pydantic import BaseModel, EmailStr, validator
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI
+import httpx
 
 # Essential imports that should always work
 import torch
@@ -67,13 +79,6 @@ import soundfile as sf
 from scipy.signal import butter, filtfilt
 
 # Optional imports with fallbacks for Railway deployment
-try:
-    import whisperx
-    WHISPERX_AVAILABLE = True
-except ImportError:
-    print("⚠️  WhisperX not available - using fallback transcription")
-    WHISPERX_AVAILABLE = False
-
 try:
     import noisereduce as nr
     NOISEREDUCE_AVAILABLE = True
@@ -102,6 +107,41 @@ except ImportError:
     HarmBlockThreshold = None
     GEMINI_AVAILABLE = False
 
+# Optional fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional async file I/O for streaming uploads to disk
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# Optional SIMD-accelerated content hashing for duplicate audio detection
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Optional C-accelerated event loop and HTTP parser (installed with uvicorn[standard]);
+# uvicorn installs them itself when started with --loop uvloop --http httptools
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httptools
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
 # Import local modules
 from database import get_db, engine, SessionLocal
 import models
@@ -109,6 +149,11 @@ import schemas
 import crud
 from config import settings
 from speaker_identification import create_speaker_identifier
+from transcription_worker import (
+    WHISPERX_AVAILABLE, FASTER_WHISPER_AVAILABLE, TORCH_NUM_THREADS,
+    WHISPERX_DEVICE, WHISPERX_BATCH_SIZE, WHISPERX_COMPUTE_TYPE, WHISPERX_MODEL_SIZE,
+    init_whisperx_worker, whisperx_transcribe_file
+)
 from audio_processor import AudioChunker
 from email_service import email_service
 
@@ -163,46 +208,68 @@ async def validate_railway_limits(file: UploadFile):
         )
     
 # Create specialized loggers
+# The file handlers run on background QueueListener threads; request handlers only
+# enqueue records, so bursts of 401/403/429 events don't wait on disk writes
 security_logger = logging.getLogger('security')
 security_handler = logging.FileHandler('security.log')
 security_handler.setFormatter(logging.Formatter(
     '%(asctime)s - SECURITY - %(levelname)s - %(message)s'
 ))
-security_logger.addHandler(security_handler)
+security_log_queue = queue.SimpleQueue()
+security_logger.addHandler(QueueHandler(security_log_queue))
 security_logger.setLevel(logging.WARNING)
+security_log_listener = QueueListener(security_log_queue, security_handler, respect_handler_level=True)
+security_log_listener.start()
+atexit.register(security_log_listener.stop)
 
 audit_logger = logging.getLogger('audit')
 audit_handler = logging.FileHandler('audit.log')
 audit_handler.setFormatter(logging.Formatter(
     '%(asctime)s - AUDIT - %(message)s'
 ))
-audit_logger.addHandler(audit_handler)
+audit_log_queue = queue.SimpleQueue()
+audit_logger.addHandler(QueueHandler(audit_log_queue))
 audit_logger.setLevel(logging.INFO)
+audit_log_listener = QueueListener(audit_log_queue, audit_handler, respect_handler_level=True)
+audit_log_listener.start()
+atexit.register(audit_log_listener.stop)
 
 app_logger = logging.getLogger('app')
 
+def dumps_json(data) -> str:
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+def loads_json(data):
+    """Parse a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def log_security_event(event_type: str, user_id: int = None, ip_address: str = None, details: dict = None):
     """Log security-related events"""
     event_data = {
         "event_type": event_type,
-        "timestamp": datetime.utcnow().isoformat(),
+        "ts_ns": time.time_ns(),  # Human-readable asctime is added by the listener thread
         "user_id": user_id,
         "ip_address": ip_address,
         "details": details or {}
     }
-    security_logger.warning(json.dumps(event_data))
+    security_logger.warning(dumps_json(event_data))
 
 def log_audit_event(action: str, user_id: int, resource_type: str, resource_id: int = None, details: dict = None):
     """Log audit trail events"""
     event_data = {
         "action": action,
-        "timestamp": datetime.utcnow().isoformat(),
+        "ts_ns": time.time_ns(),  # Human-readable asctime is added by the listener thread
         "user_id": user_id,
         "resource_type": resource_type,
         "resource_id": resource_id,
         "details": details or {}
     }
-    audit_logger.info(json.dumps(event_data))
+    audit_logger.info(dumps_json(event_data))
 
 # Request logging middleware
 # @app.middleware("http")  # COMMENTED OUT - MOVED AFTER APP CREATION
@@ -247,10 +314,22 @@ async def log_requests(request: Request, call_next):
 # Create database tables
 models.Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared clients and the worker pool when the server shuts down"""
+    yield
+    # Close the shared async OpenAI client's connections on the loop that opened them
+    if _openai_client is not None:
+        await _openai_client.close()
+    # The pool workers hold their models for the life of the process; release them here
+    if _whisperx_pool is not None:
+        _whisperx_pool.shutdown(wait=False, cancel_futures=True)
+
 app = FastAPI(
     title="Meeting Transcription API",
     description="API for real-time meeting transcription and analysis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Record app start time for health check uptime calculation
@@ -290,43 +369,51 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     response.headers["Retry-After"] = str(getattr(exc, 'retry_after', 60))
     return response
 
+# Security headers, encoded once; the middleware appends them to the raw header list
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", (
+        b"default-src 'self'; "
+        b"script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+        b"style-src 'self' 'unsafe-inline'; "
+        b"img-src 'self' data: https:; "
+        b"font-src 'self' https:; "
+        b"connect-src 'self' ws: wss:; "
+        b"media-src 'self'; "
+        b"object-src 'none'; "
+        b"base-uri 'self'; "
+        b"form-action 'self'"
+    )),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", (
+        b"geolocation=(), "
+        b"microphone=(), "
+        b"camera=(), "
+        b"payment=(), "
+        b"usb=(), "
+        b"magnetometer=(), "
+        b"gyroscope=(), "
+        b"speaker=()"
+    )),
+]
+# Names that must not appear twice; "server" is only ever removed
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in _SECURITY_HEADERS) | {b"server"}
+
 # Security headers middleware
 @app.middleware("http")
 async def add_security_headers(request: Request, call_next):
     response = await call_next(request)
     
-    # Security headers
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-    response.headers["Content-Security-Policy"] = (
-        "default-src 'self'; "
-        "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-        "style-src 'self' 'unsafe-inline'; "
-        "img-src 'self' data: https:; "
-        "font-src 'self' https:; "
-        "connect-src 'self' ws: wss:; "
-        "media-src 'self'; "
-        "object-src 'none'; "
-        "base-uri 'self'; "
-        "form-action 'self'"
-    )
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = (
-        "geolocation=(), "
-        "microphone=(), "
-        "camera=(), "
-        "payment=(), "
-        "usb=(), "
-        "magnetometer=(), "
-        "gyroscope=(), "
-        "speaker=()"
-    )
+    raw_headers = response.raw_headers
+    # Rare: the endpoint already set one of these (or Server); drop it so ours wins
+    if any(name in _SECURITY_HEADER_NAMES for name, _ in raw_headers):
+        raw_headers[:] = [header for header in raw_headers if header[0] not in _SECURITY_HEADER_NAMES]
     
-    # Remove server information
-    if "Server" in response.headers:
-        del response.headers["Server"]
+    # Security headers
+    raw_headers.extend(_SECURITY_HEADERS)
     
     return response
 
@@ -339,7 +426,6 @@ def get_allowed_origins():
         try:
             # Use settings object instead of direct environment access
             origins_str = settings.BACKEND_CORS_ORIGINS
-            print(f"[CORS] Raw origins string: {origins_str}")
             
             if origins_str:
                 # Parse comma-separated origins (handle semicolons too)
@@ -360,27 +446,22 @@ def get_allowed_origins():
                     
                     if origin and (origin.startswith(("http://", "https://")) or origin == "*"):
                         origins.append(origin)
-                        print(f"[CORS] Added origin: {origin}")
                 
                 if origins:
-                    print(f"[CORS] Final origins: {origins}")
                     return origins
             
             # Default production origins if nothing valid found
             default_origins = [
                 "https://ai-meeting-indol.vercel.app",
             ]
-            print(f"[CORS] Using default production origins: {default_origins}")
             return default_origins
             
         except Exception as e:
             app_logger.error(f"Error parsing CORS origins: {e}")
-            print(f"[CORS] Exception occurred: {e}")
             # Return safe defaults for production
             default_origins = [
                 "https://ai-meeting-indol.vercel.app",
             ]
-            print(f"[CORS] Using fallback production origins: {default_origins}")
             return default_origins
     else:
         # Development - allow all common local development origins
@@ -392,11 +473,10 @@ def get_allowed_origins():
             "http://localhost:8080",
             "http://127.0.0.1:8080",
         ]
-        print(f"[CORS] Using development origins: {dev_origins}")
         return dev_origins
 
 allowed_origins = get_allowed_origins()
-app_logger.info(f"CORS allowed origins: {allowed_origins}")
+app_logger.info("CORS allowed origins: %s", allowed_origins)
 
 # Environment detection
 is_production = os.getenv("ENVIRONMENT", "development") == "production"
@@ -481,6 +561,27 @@ app.add_middleware(
     https_only=is_production
 )
 
+# Health check responses are fixed, so everything but the /healthz timestamp is
+# computed once at startup instead of on every request
+_IS_RAILWAY = bool(os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("RAILWAY_PROJECT_ID"))
+_HEALTH_PATHS = frozenset({"/health", "/healthz", "/ready"})
+# Per-request health/request tracing is opt-in; stdout writes on every probe are costly
+_HEALTH_DEBUG = os.getenv("HEALTH_DEBUG") == "1"
+_HEALTH_OK_BYTES = b'{"status":"ok"}'
+_READY_OK_BYTES = b'{"status":"ready","service":"stocks-agent-api"}'
+_HEALTH_RESPONSE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+if _IS_RAILWAY:
+    # Add Railway-specific headers if detected
+    _HEALTH_RESPONSE_HEADERS.update({
+        "X-Railway-Health": "ok",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
+    })
+
 # CRITICAL: Health middleware added LAST so it's processed FIRST (FastAPI middleware is processed in reverse order)
 # This ensures health endpoints completely bypass ALL middleware including TrustedHostMiddleware
 @app.middleware("http")
@@ -489,51 +590,27 @@ async def health_first_middleware(request: Request, call_next):
     CRITICAL: Health endpoint middleware that runs FIRST to bypass all other middleware.
     Must be added LAST to be processed FIRST due to FastAPI's reverse middleware order.
     """
-    # Check for Railway environment
-    is_railway = bool(os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("RAILWAY_PROJECT_ID"))
-    
-    # Debug logging for Railway health checks
-    if request.url.path in ["/health", "/healthz", "/ready"]:
-        print(f"[HEALTH] Railway Environment: {is_railway}")
-        print(f"[HEALTH] Processing {request.url.path} request from {request.client}")
-        print(f"[HEALTH] Request method: {request.method}")
-        print(f"[HEALTH] Request URL: {request.url}")
-        print(f"[HEALTH] Request headers: {dict(request.headers)}")
+    path = request.url.path
+    if path in _HEALTH_PATHS:
+        if _HEALTH_DEBUG:
+            app_logger.debug("[HEALTH] Processing %s request from %s (Railway: %s)", path, request.client, _IS_RAILWAY)
         
         try:
             # Create direct response without going through any other middleware
-            if request.url.path == "/health":
-                response_data = {"status": "ok"}
-            elif request.url.path == "/healthz":
-                response_data = {"status": "ok", "timestamp": time.time()}
-            elif request.url.path == "/ready":
-                response_data = {"status": "ready", "service": "stocks-agent-api"}
-            
-            print(f"[HEALTH] Returning response: {response_data}")
-            response = JSONResponse(content=response_data, status_code=200)
-            
-            # Add headers for Railway compatibility
-            response.headers["Content-Type"] = "application/json"
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-            
-            # Add Railway-specific headers if detected
-            if is_railway:
-                response.headers["X-Railway-Health"] = "ok"
-                response.headers["Access-Control-Allow-Origin"] = "*"
-                response.headers["Access-Control-Allow-Methods"] = "GET, HEAD, OPTIONS"
+            if path == "/health":
+                content = _HEALTH_OK_BYTES
+            elif path == "/healthz":
+                content = b'{"status":"ok","timestamp":%r}' % time.time()
+            else:
+                content = _READY_OK_BYTES
             
-            print(f"[HEALTH] Response headers: {dict(response.headers)}")
-            print(f"[HEALTH] Response status: {response.status_code}")
-            print(f"[HEALTH] Response created successfully for {request.url.path}")
+            response = Response(content=content, media_type="application/json", headers=_HEALTH_RESPONSE_HEADERS)
+            if _HEALTH_DEBUG:
+                app_logger.debug("[HEALTH] Response created successfully for %s", path)
             return response
             
         except Exception as health_error:
-            print(f"[HEALTH] Error in health middleware: {health_error}")
-            print(f"[HEALTH] Error type: {type(health_error)}")
-            import traceback
-            print(f"[HEALTH] Error traceback: {traceback.format_exc()}")
+            app_logger.error("[HEALTH] Error in health middleware: %r", health_error, exc_info=True)
             
             # Absolute fallback - return plain text
             fallback_response = PlainTextResponse(
@@ -545,11 +622,13 @@ async def health_first_middleware(request: Request, call_next):
                     "X-Health-Fallback": "true"
                 }
             )
-            print(f"[HEALTH] Fallback response created")
+            if _HEALTH_DEBUG:
+                app_logger.debug("[HEALTH] Fallback response created")
             return fallback_response
     
     # For all other endpoints, continue with normal middleware processing
-    print(f"[REQUEST] Non-health request: {request.method} {request.url.path}")
+    if _HEALTH_DEBUG:
+        app_logger.debug("[REQUEST] Non-health request: %s %s", request.method, path)
     response = await call_next(request)
     return response
 
@@ -566,382 +645,256 @@ def get_db():
 # Use settings object for API keys
 GEMINI_API_KEY = settings.GEMINI_API_KEY
 
+# Shared API clients: one connection pool reused across requests instead of a new
+# client (and TCP/TLS handshake) per call
+_openai_client = None
+_gemini_model = None
+
+def get_openai_client() -> AsyncOpenAI:
+    """Get the shared async OpenAI client; requests are awaited on the event loop"""
+    global _openai_client
+    if _openai_client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=60.0,  # Explicit timeout
+            max_retries=2,  # Explicit retry count
+            http_client=http_client
+        )
+    return _openai_client
+
+def get_gemini_model():
+    """Get the shared Gemini model, configuring the API key on first use"""
+    global _gemini_model
+    if _gemini_model is None:
+        genai.configure(api_key=GEMINI_API_KEY)
+        _gemini_model = genai.GenerativeModel("models/gemini-1.5-pro-latest")
+    return _gemini_model
+
 # Suppress Whisper FP16 warning
 warnings.filterwarnings("ignore", message="FP16 is not supported on CPU; using FP32 instead", module="whisper.transcribe")
 
-# Global cache for speaker identifier to avoid reloading models
-_speaker_identifier_cache = None
+# Single-pass translation table for get_safe_email_for_path
+_EMAIL_PATH_TRANSLATION = str.maketrans({"@": "_at_", ".": "_", "/": "_", "\\": "_"})
 
+@functools.lru_cache(maxsize=10_000)
 def get_safe_email_for_path(email: str) -> str:
     """Convert email to a safe filename format"""
-    return email.replace("@", "_at_").replace(".", "_").replace("/", "_").replace("\\", "_")
-
-def get_cached_speaker_identifier():
-    """Get a cached speaker identifier to avoid reloading heavy models"""
-    global _speaker_identifier_cache
-    if _speaker_identifier_cache is None:
-        _speaker_identifier_cache = create_speaker_identifier()
-    return _speaker_identifier_cache
-
-def get_audio_file_hash(file_path: str) -> str:
-    """Generate a hash for an audio file to enable caching"""
-    try:
-        with open(file_path, 'rb') as f:
-            # Read first and last 1KB for quick hash (compromise between speed and uniqueness)
-            start = f.read(1024)
-            f.seek(-1024, 2)  # Seek to 1KB from end
-            end = f.read(1024)
-            file_size = os.path.getsize(file_path)
-            
-        content = start + end + str(file_size).encode()
-        return hashlib.md5(content).hexdigest()
-    except Exception:
-        return hashlib.md5(file_path.encode()).hexdigest()
+    return email.translate(_EMAIL_PATH_TRANSLATION)
 
 # Simple in-memory cache for processed audio files
 _audio_processing_cache = {}
 
-def process_single_audio_file(audio_file: str) -> List[dict]:
-    """Process a single audio file with caching"""
-    file_hash = get_audio_file_hash(audio_file)
-    
-    # Check cache first
-    if file_hash in _audio_processing_cache:
-        print(f"Using cached results for {os.path.basename(audio_file)}")
-        return _audio_processing_cache[file_hash]
-    
+# Lazily created Redis client shared by the LLM response cache
+_redis_client = None
+_redis_unavailable = False
+
+def get_redis_client():
+    """Return a connected Redis client, or None if Redis is not configured/reachable"""
+    global _redis_client, _redis_unavailable
+    if _redis_client is not None or _redis_unavailable:
+        return _redis_client
+    if not settings.REDIS_URL:
+        _redis_unavailable = True
+        return None
     try:
-        print(f"Processing audio file for speaker analysis: {audio_file}")
-        
-        # Check if file exists and is readable
-        if not os.path.exists(audio_file):
-            print(f"Audio file does not exist: {audio_file}")
-            return []
-            
-        # Check file size
-        file_size = os.path.getsize(audio_file)
-        if file_size == 0:
-            print(f"Audio file is empty: {audio_file}")
-            return []
-            
-        print(f"File size: {file_size} bytes")
-        
-        # Use cached speaker identifier
-        speaker_identifier = get_cached_speaker_identifier()
-        segments = speaker_identifier.process_audio(audio_file)
-        
-        # Add file-specific context
-        filename = os.path.basename(audio_file)
-        file_segments = []
-        
-        for segment in segments:
-            refined_segment = segment.copy()
-            refined_segment["source_file"] = filename
-            file_segments.append(refined_segment)
-        
-        # Cache the results
-        _audio_processing_cache[file_hash] = file_segments
-        
-        print(f"Extracted {len(file_segments)} segments from {filename}")
-        return file_segments
-        
+        # Bounded pool: callers wait up to 1s for a free connection instead of opening
+        # new ones under bursts; keepalive survives idle proxy timeouts
+        pool = redis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=50,
+            timeout=1.0,
+            socket_keepalive=True,
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+        client = redis.Redis(connection_pool=pool)
+        client.ping()
+        _redis_client = client
+        print("[Cache] Connected to Redis for LLM response caching")
     except Exception as e:
-        print(f"Error processing audio file {audio_file}: {e}")
-        if "Format not recognised" in str(e):
-            print(f"Audio format issue with {audio_file}. This might be due to incorrect file format or corruption.")
-        return []
+        print(f"[Cache] Redis unavailable, using in-process cache: {e}")
+        _redis_unavailable = True
+    return _redis_client
+
+# LLM responses keyed by a hash of model, prompt and transcript, so repeated requests
+# for an unchanged meeting skip the GPT-4o round trip; the in-process fallback keeps
+# only the most recent entries
+_llm_response_cache = {}
+LLM_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+def llm_cache_key(kind: str, *parts: str) -> str:
+    """Content-addressed cache key for an LLM request"""
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return f"llm:v1:{kind}:{digest.hexdigest()}"
+
+def get_cached_llm_response(key: str):
+    """Look up a cached LLM response"""
+    client = get_redis_client()
+    if client is None:
+        return _llm_response_cache.get(key)
+    try:
+        cached = client.get(key)
+        return loads_json(cached) if cached is not None else None
+    except Exception as e:
+        print(f"[Cache] Error reading LLM response from Redis: {e}")
+        return None
+
+def cache_llm_response(key: str, response) -> None:
+    """Store an LLM response under its content key"""
+    client = get_redis_client()
+    if client is None:
+        if len(_llm_response_cache) >= LLM_RESPONSE_CACHE_MAX_ENTRIES:
+            _llm_response_cache.pop(next(iter(_llm_response_cache)))
+        _llm_response_cache[key] = response
+        return
+    try:
+        client.set(key, dumps_json(response), ex=settings.LLM_CACHE_TTL_SECONDS)
+    except Exception as e:
+        print(f"[Cache] Error writing LLM response to Redis: {e}")
+
+# Summary endpoint responses keyed by the ETag of the (summary, meeting notes) pair they
+# were built from, so entries hold a digest rather than both documents; a stored pair
+# never changes, so entries need no invalidation
+STORED_SUMMARY_RESPONSE_MAX_ENTRIES = 256
+_stored_summary_responses = {}
+
+def stored_summary_etag(summary_content: str, meeting_notes_content: str) -> str:
+    """Strong ETag for the summary endpoint response built from a stored summary/notes pair"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(summary_content.encode())
+    digest.update(b"\0")
+    digest.update(meeting_notes_content.encode())
+    return f'"{digest.hexdigest()}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header lists the given ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def remember_stored_summary_response(etag: str, response_data: dict) -> None:
+    """Keep the response built from the stored summary/notes pair with this ETag for later requests"""
+    if len(_stored_summary_responses) >= STORED_SUMMARY_RESPONSE_MAX_ENTRIES:
+        _stored_summary_responses.pop(next(iter(_stored_summary_responses)))
+    _stored_summary_responses[etag] = dict(response_data)
 
-async def perform_comprehensive_speaker_analysis(audio_files: List[str]) -> List[dict]:
+# Pin the server's own torch threads the same way as the pool workers'
+torch.set_num_threads(TORCH_NUM_THREADS)
+
+def get_worker_pool_size() -> int:
+    """Number of model worker processes that fit on the CPUs available to this process"""
+    if hasattr(os, "sched_getaffinity"):
+        cpu_quota = len(os.sched_getaffinity(0))
+    else:
+        cpu_quota = os.cpu_count() or 1
+    return max(1, min(settings.MAX_CONCURRENT_AUDIO_PROCESSING, cpu_quota // TORCH_NUM_THREADS))
+
+def get_worker_mp_context():
     """
-    Perform comprehensive speaker diarization on all audio files with optimizations
-    Returns refined speaker segments with improved accuracy
+    Start context for the model worker pool. Workers come from a forkserver rather than
+    a fork of the server: the server runs QueueListener threads and an event loop, and a
+    fork copies their locks in whatever state they are in, which can deadlock the child.
+    The forkserver preloads only transcription_worker, never main, so workers skip the
+    server's database, logging and app setup and load their models in the pool initializer.
     """
-    if not audio_files:
-        return []
-    
-    print(f"[SpeakerAnalysis] Starting speaker analysis for {len(audio_files)} audio files")
-    
-    # Limit the number of files to prevent excessive processing
-    MAX_AUDIO_FILES = 10
-    if len(audio_files) > MAX_AUDIO_FILES:
-        print(f"[SpeakerAnalysis] Warning: Too many audio files ({len(audio_files)}), limiting to {MAX_AUDIO_FILES}")
-        audio_files = audio_files[:MAX_AUDIO_FILES]
-    
-    # Process files in parallel for better performance
-    max_workers = min(len(audio_files), 3)  # Limit to 3 workers to avoid overwhelming the system
-    all_segments = []
-    
-    print(f"[SpeakerAnalysis] Processing files with {max_workers} workers")
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks with timeout
-        future_to_file = {}
-        for audio_file in audio_files:
-            future = executor.submit(process_single_audio_file, audio_file)
-            future_to_file[future] = audio_file
-        
-        # Collect results as they complete with timeout
-        completed_files = 0
-        for future in concurrent.futures.as_completed(future_to_file, timeout=240):  # 4 minute timeout total
-            audio_file = future_to_file[future]
-            completed_files += 1
-            
-            try:
-                print(f"[SpeakerAnalysis] Processing file {completed_files}/{len(audio_files)}: {os.path.basename(audio_file)}")
-                file_segments = future.result(timeout=60)  # 1 minute timeout per file
-                all_segments.extend(file_segments)
-                print(f"[SpeakerAnalysis] File {completed_files} completed, got {len(file_segments)} segments")
-            except concurrent.futures.TimeoutError:
-                print(f"[SpeakerAnalysis] Timeout processing {audio_file}, skipping")
-            except Exception as e:
-                print(f"[SpeakerAnalysis] Error processing {audio_file}: {e}")
-    
-    print(f"[SpeakerAnalysis] Collected {len(all_segments)} total segments from all files")
-    
-    # Perform cross-file speaker clustering to improve consistency
-    print(f"[SpeakerAnalysis] Starting speaker clustering...")
-    refined_segments = cluster_speakers_across_files(all_segments)
-    
-    print(f"[SpeakerAnalysis] Comprehensive analysis complete: {len(refined_segments)} refined segments")
-    return refined_segments
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["transcription_worker"])
+        return context
+    return None
 
-def cluster_speakers_across_files(segments: List[dict]) -> List[dict]:
+def consistent_speaker_mapping(speakers) -> Dict[str, str]:
     """
-    Cluster speakers across multiple audio files to ensure consistent labeling
+    Map speakers, in order of first appearance, to consistent labels: diarization
+    labels (SPEAKER_xx) and missing speakers become Speaker_N, named speakers stay
     """
-    # Group segments by original speaker label
-    speaker_groups = {}
-    for segment in segments:
-        speaker = segment["speaker"]
-        if speaker not in speaker_groups:
-            speaker_groups[speaker] = []
-        speaker_groups[speaker].append(segment)
-    
-    # For now, use a simple mapping approach
-    # In a more sophisticated implementation, you could use voice embeddings
-    # to cluster speakers more accurately across files
-    
-    refined_segments = []
     speaker_mapping = {}
     next_speaker_id = 1
-    
-    for original_speaker, speaker_segments in speaker_groups.items():
-        # Create a consistent speaker ID across all files
-        if original_speaker not in speaker_mapping:
-            speaker_mapping[original_speaker] = f"Speaker_{next_speaker_id}"
-            next_speaker_id += 1
-        
-        consistent_speaker_id = speaker_mapping[original_speaker]
-        
-        # Update all segments with the consistent speaker ID
-        for segment in speaker_segments:
-            refined_segment = segment.copy()
-            refined_segment["refined_speaker"] = consistent_speaker_id
-            refined_segment["original_speaker"] = original_speaker
-            refined_segments.append(refined_segment)
-    
-    # Sort segments by start time for chronological order
-    refined_segments.sort(key=lambda x: x.get("start_time", 0))
-    
-    print(f"Speaker clustering complete: {len(speaker_mapping)} unique speakers identified")
-    return refined_segments
+    for speaker in speakers:
+        current_speaker = speaker or "Unknown"
+        if current_speaker not in speaker_mapping:
+            if current_speaker == "Unknown" or current_speaker.startswith("SPEAKER_"):
+                speaker_mapping[current_speaker] = f"Speaker_{next_speaker_id}"
+                next_speaker_id += 1
+            else:
+                speaker_mapping[current_speaker] = current_speaker
+    return speaker_mapping
 
-async def update_transcriptions_with_refined_speakers(
-    db: Session, 
-    meeting_id: int, 
-    refined_segments: List[dict]
-) -> int:
+# Prebuilt per-row relabel, executed once with a list of parameter sets (executemany)
+_RELABEL_TRANSCRIPTION_STMT = models.Transcription.__table__.update().where(
+    models.Transcription.__table__.c.meeting_id == bindparam("_meeting_id"),
+    models.Transcription.__table__.c.id == bindparam("_id")
+).values(speaker=bindparam("new_speaker"))
+
+def relabel_transcription_rows(db: Session, meeting_id: int, transcriptions, speaker_mapping: Dict[str, str]) -> int:
     """
-    Update existing transcriptions with refined speaker labels (optimized)
+    Relabel already-loaded (id, speaker) rows through speaker_mapping with a single
+    executemany of one prepared UPDATE; returns the number of rows changed
     """
-    updated_count = 0
-    
-    try:
-        print(f"[TranscriptionUpdate] Starting transcription updates for meeting {meeting_id}")
-        
-        # Get all existing transcriptions for this meeting
-        transcriptions = db.query(models.Transcription).filter(
-            models.Transcription.meeting_id == meeting_id
-        ).order_by(models.Transcription.timestamp).all()
-        
-        print(f"[TranscriptionUpdate] Found {len(transcriptions)} existing transcriptions to update")
-        print(f"[TranscriptionUpdate] Found {len(refined_segments)} refined segments to match against")
-        
-        if not transcriptions or not refined_segments:
-            print(f"[TranscriptionUpdate] No transcriptions or segments to process")
-            return 0
-        
-        # Limit processing to prevent infinite loops
-        MAX_TRANSCRIPTIONS = 1000
-        MAX_SEGMENTS = 5000
-        
-        if len(transcriptions) > MAX_TRANSCRIPTIONS:
-            print(f"[TranscriptionUpdate] Warning: Too many transcriptions ({len(transcriptions)}), limiting to {MAX_TRANSCRIPTIONS}")
-            transcriptions = transcriptions[:MAX_TRANSCRIPTIONS]
-        
-        if len(refined_segments) > MAX_SEGMENTS:
-            print(f"[TranscriptionUpdate] Warning: Too many segments ({len(refined_segments)}), limiting to {MAX_SEGMENTS}")
-            refined_segments = refined_segments[:MAX_SEGMENTS]
-        
-        # Create an index of refined segments by text for faster lookup
-        print(f"[TranscriptionUpdate] Creating segment index...")
-        segment_text_index = {}
-        for i, segment in enumerate(refined_segments):
-            if i % 100 == 0:  # Progress indicator
-                print(f"[TranscriptionUpdate] Indexing segment {i}/{len(refined_segments)}")
-            
-            text_key = segment.get("text", "").lower().strip()
-            if text_key:
-                if text_key not in segment_text_index:
-                    segment_text_index[text_key] = []
-                segment_text_index[text_key].append(segment)
-        
-        print(f"[TranscriptionUpdate] Created index with {len(segment_text_index)} unique text keys")
-        
-        # Batch update operations
-        updates_to_apply = []
-        
-        # Create a mapping strategy based on text similarity and timing
-        print(f"[TranscriptionUpdate] Finding matches for transcriptions...")
-        for i, transcription in enumerate(transcriptions):
-            if i % 50 == 0:  # Progress indicator
-                print(f"[TranscriptionUpdate] Processing transcription {i}/{len(transcriptions)}")
-            
-            # Find the best matching refined segment (optimized)
-            best_match = find_best_matching_segment_optimized(transcription, refined_segments, segment_text_index)
-            
-            if best_match and best_match.get("refined_speaker"):
-                old_speaker = transcription.speaker
-                new_speaker = best_match["refined_speaker"]
-                
-                if old_speaker != new_speaker:  # Only update if different
-                    updates_to_apply.append({
-                        'id': transcription.id,
-                        'old_speaker': old_speaker,
-                        'new_speaker': new_speaker
-                    })
-        
-        print(f"[TranscriptionUpdate] Found {len(updates_to_apply)} transcriptions to update")
-        
-        # Apply bulk updates if any
-        if updates_to_apply:
-            # Limit batch size to prevent database issues
-            BATCH_SIZE = 100
-            
-            for batch_start in range(0, len(updates_to_apply), BATCH_SIZE):
-                batch_end = min(batch_start + BATCH_SIZE, len(updates_to_apply))
-                batch = updates_to_apply[batch_start:batch_end]
-                
-                print(f"[TranscriptionUpdate] Processing batch {batch_start//BATCH_SIZE + 1}/{(len(updates_to_apply) + BATCH_SIZE - 1)//BATCH_SIZE}")
-                
-                # Use bulk update for better performance
-                for update in batch:
-                    db.query(models.Transcription).filter(
-                        models.Transcription.id == update['id']
-                    ).update({'speaker': update['new_speaker']})
-                    updated_count += 1
-                
-                # Commit each batch
-                db.commit()
-                print(f"[TranscriptionUpdate] Committed batch, total updated: {updated_count}")
-            
-            print(f"[TranscriptionUpdate] Successfully updated {updated_count} transcriptions in total")
-        else:
-            print("[TranscriptionUpdate] No transcriptions needed updating")
-        
-    except Exception as e:
-        print(f"[TranscriptionUpdate] Error updating transcriptions: {e}")
-        db.rollback()
-        raise e
-    
-    return updated_count
+    params = []
+    for transcription in transcriptions:
+        new_speaker = speaker_mapping[transcription.speaker or "Unknown"]
+        if transcription.speaker != new_speaker:
+            params.append({"_meeting_id": meeting_id, "_id": transcription.id, "new_speaker": new_speaker})
+    if params:
+        db.execute(_RELABEL_TRANSCRIPTION_STMT, params)
+        db.commit()
+    return len(params)
 
-def find_best_matching_segment_optimized(
-    transcription: models.Transcription, 
-    refined_segments: List[dict],
-    segment_text_index: dict
-) -> dict:
+def relabel_speakers_consistently(db: Session, meeting_id: int):
     """
-    Find the best matching refined segment for a given transcription (optimized)
-    Uses text similarity and other heuristics with indexing for better performance
+    Map diarization labels (SPEAKER_xx or missing) to Speaker_N in order of first
+    appearance and rename them server-side with one UPDATE per distinct old label.
+    Returns (speaker_mapping, updated_count, transcription_count)
     """
-    transcription_text = transcription.text.lower().strip()
-    
-    if not transcription_text:
-        return None
-    
-    # First try exact match from index
-    if transcription_text in segment_text_index:
-        candidates = segment_text_index[transcription_text]
-        if candidates:
-            # If multiple exact matches, prefer one with similar speaker
-            for candidate in candidates:
-                if transcription.speaker in candidate.get("original_speaker", ""):
-                    return candidate
-            return candidates[0]  # Return first exact match
-    
-    # If no exact match, try fuzzy matching with a subset of segments
-    best_match = None
-    best_score = 0
-    
-    # Create word set for transcription for faster comparison
-    transcription_words = set(transcription_text.split())
-    
-    # Limit the number of segments to check to prevent infinite loops
-    MAX_SEGMENTS_TO_CHECK = 500
-    segments_checked = 0
-    
-    # Only check segments that have at least one word in common
-    for segment in refined_segments:
-        # Safety check to prevent infinite loops
-        segments_checked += 1
-        if segments_checked > MAX_SEGMENTS_TO_CHECK:
-            print(f"[SegmentMatching] Reached maximum segments to check ({MAX_SEGMENTS_TO_CHECK}), stopping search")
-            break
-        
-        segment_text = segment.get("text", "").lower().strip()
-        if not segment_text:
-            continue
-            
-        segment_words = set(segment_text.split())
-        
-        # Quick check: if no common words, skip
-        if not transcription_words.intersection(segment_words):
-            continue
-        
-        # Calculate similarity score (optimized)
-        similarity_score = calculate_text_similarity_optimized(transcription_words, segment_words)
-        
-        # Boost score if speakers are similar (for consistency)
-        if transcription.speaker in segment.get("original_speaker", ""):
-            similarity_score += 0.2
-        
-        if similarity_score > best_score and similarity_score > 0.3:  # Minimum threshold
-            best_score = similarity_score
-            best_match = segment
-            
-            # Early termination if we find a very good match
-            if similarity_score > 0.9:
-                break
+    first_seen = func.min(models.Transcription.timestamp)
+    speaker_rows = db.query(
+        models.Transcription.speaker,
+        func.count(models.Transcription.id),
+        first_seen
+    ).filter(
+        models.Transcription.meeting_id == meeting_id
+    ).group_by(models.Transcription.speaker).order_by(first_seen).all()
     
-    return best_match
-
-def calculate_text_similarity_optimized(words1: set, words2: set) -> float:
-    """Calculate text similarity using Jaccard similarity for optimization."""
-    if not words1 or not words2:
-        return 0.0
+    speaker_mapping = consistent_speaker_mapping(speaker for speaker, _, _ in speaker_rows)
     
-    intersection = len(words1.intersection(words2))
-    union = len(words1.union(words2))
+    updated_count = 0
+    for speaker, count, _ in speaker_rows:
+        new_speaker = speaker_mapping[speaker or "Unknown"]
+        if speaker != new_speaker:
+            if speaker is None:
+                speaker_filter = models.Transcription.speaker.is_(None)
+            else:
+                speaker_filter = models.Transcription.speaker == speaker
+            db.query(models.Transcription).filter(
+                models.Transcription.meeting_id == meeting_id,
+                speaker_filter
+            ).update({"speaker": new_speaker}, synchronize_session=False)
+            updated_count += count
+    
+    if updated_count > 0:
+        db.commit()
     
-    return intersection / union if union > 0 else 0.0
+    return speaker_mapping, updated_count, sum(count for _, count, _ in speaker_rows)
 
 def migrate_existing_files(db: Session):
     """Migrate existing files from old structure to new user-based structure"""
     # This function can be called once to migrate existing files
     # Pattern: /tmp/meeting_{meeting_id}_{timestamp}.wav
-    old_pattern = "/tmp/meeting_*.wav"
-    old_files = glob.glob(old_pattern)
+    with os.scandir("/tmp") as entries:
+        old_files = [
+            entry.path for entry in entries
+            if entry.name.startswith("meeting_") and entry.name.endswith(".wav") and entry.is_file()
+        ]
     
     migrated_count = 0
     failed_count = 0
@@ -949,33 +902,44 @@ def migrate_existing_files(db: Session):
     if old_files:
         print(f"Found {len(old_files)} files to migrate from old structure")
         
+        # Parse every filename first so all owning meetings load in one IN query
+        parsed_files = []
         for file_path in old_files:
+            filename = os.path.basename(file_path)
+            # Format: meeting_{meeting_id}_{timestamp}.wav
+            parts = filename.replace('.wav', '').split('_')
+            try:
+                if len(parts) < 3 or parts[0] != 'meeting':
+                    raise ValueError(filename)
+                parsed_files.append((file_path, filename, int(parts[1])))
+            except ValueError:
+                print(f"Could not parse meeting_id from filename: {filename}")
+                failed_count += 1
+        
+        meeting_ids = {meeting_id for _, _, meeting_id in parsed_files}
+        meetings = {
+            meeting.id: meeting
+            for meeting in db.query(models.Meeting).options(joinedload(models.Meeting.owner)).filter(
+                models.Meeting.id.in_(meeting_ids)
+            ).all()
+        } if meeting_ids else {}
+        
+        for file_path, filename, meeting_id in parsed_files:
             try:
-                # Extract meeting_id from filename
-                filename = os.path.basename(file_path)
-                # Format: meeting_{meeting_id}_{timestamp}.wav
-                parts = filename.replace('.wav', '').split('_')
-                if len(parts) >= 3 and parts[0] == 'meeting':
-                    meeting_id = int(parts[1])
+                meeting = meetings.get(meeting_id)
+                if meeting and meeting.owner:
+                    # Create new directory structure
+                    safe_email = get_safe_email_for_path(meeting.owner.email)
+                    new_dir = f"/tmp/meetings/{safe_email}/{meeting_id}"
+                    os.makedirs(new_dir, exist_ok=True)
                     
-                    # Look up the meeting owner
-                    meeting = db.query(models.Meeting).filter(models.Meeting.id == meeting_id).first()
-                    if meeting and meeting.owner:
-                        # Create new directory structure
-                        safe_email = get_safe_email_for_path(meeting.owner.email)
-                        new_dir = f"/tmp/meetings/{safe_email}/{meeting_id}"
-                        os.makedirs(new_dir, exist_ok=True)
-                        
-                        # Move file to new location
-                        new_path = os.path.join(new_dir, filename)
-                        os.rename(file_path, new_path)
-                        print(f"Migrated: {file_path} -> {new_path}")
-                        migrated_count += 1
-                    else:
-                        print(f"Could not find meeting owner for file: {file_path}")
-                        failed_count += 1
+                    # Move file to new location
+                    new_path = os.path.join(new_dir, filename)
+                    os.rename(file_path, new_path)
+                    print(f"Migrated: {file_path} -> {new_path}")
+                    migrated_count += 1
                 else:
-                    print(f"Could not parse meeting_id from filename: {filename}")
+                    print(f"Could not find meeting owner for file: {file_path}")
                     failed_count += 1
                     
             except Exception as e:
@@ -983,7 +947,30 @@ def migrate_existing_files(db: Session):
                 failed_count += 1
     
     return {"migrated": migrated_count, "failed": failed_count, "total": len(old_files)}
-    
+
+# Decoded JWT payloads keyed by a digest of the token, so reconnecting WebSocket
+# clients skip signature verification until the token's own expiry
+_ws_token_cache: Dict[bytes, dict] = {}
+_WS_TOKEN_CACHE_MAX = 1024
+
+def decode_ws_token(token: str) -> dict:
+    """Decode a WebSocket auth token, reusing cached payloads until they expire"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _ws_token_cache.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        del _ws_token_cache[key]
+
+    # Raises JWTError for invalid or expired tokens; those are never cached
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    if len(_ws_token_cache) >= _WS_TOKEN_CACHE_MAX:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _ws_token_cache[next(iter(_ws_token_cache))]
+    _ws_token_cache[key] = payload
+    return payload
+
 async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1217,12 +1204,7 @@ def get_meeting_transcriptions(
     current_user: models.User = Depends(get_current_user)
 ):
     # Verify the meeting exists and belongs to the current user
-    meeting = db.query(models.Meeting).filter(
-        models.Meeting.id == meeting_id,
-        models.Meeting.owner_id == current_user.id
-    ).first()
-    
-    if not meeting:
+    if not crud.owns_meeting(db, meeting_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meeting not found"
@@ -1231,7 +1213,7 @@ def get_meeting_transcriptions(
     # Get all transcriptions for this meeting, ordered by timestamp
     transcriptions = db.query(models.Transcription).filter(
         models.Transcription.meeting_id == meeting_id
-    ).order_by(models.Transcription.timestamp).all()
+    ).order_by(models.Transcription.timestamp, models.Transcription.id).all()
     
     return transcriptions
 
@@ -1286,15 +1268,24 @@ async def transcribe_meeting(
         # Convert audio to proper WAV format for speaker diarization if needed
         try:
             print(f"[Transcribe] Converting audio format...")
-            # Use pydub to convert the audio to proper WAV format
-            audio_segment = AudioSegment.from_file(audio_filename)
-            # Convert to mono, 16kHz for consistency
-            audio_segment = audio_segment.set_channels(1).set_frame_rate(16000)
-            
             # Create new filename for converted audio
             base_name = os.path.splitext(audio_filename)[0]
             converted_filename = f"{base_name}_converted.wav"
-            audio_segment.export(converted_filename, format="wav")
+            
+            # Decode, downmix to mono and resample to 16kHz in a single ffmpeg pass
+            # (libswresample), without holding the PCM in Python or blocking the loop
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+                "-i", audio_filename,
+                "-ac", "1", "-ar", "16000", "-f", "wav", converted_filename,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await process.communicate()
+            if process.returncode != 0:
+                if os.path.exists(converted_filename):
+                    os.remove(converted_filename)
+                raise RuntimeError(f"ffmpeg exited with {process.returncode}: {stderr.decode(errors='replace').strip()}")
             
             # Replace original with converted version
             os.remove(audio_filename)
@@ -1333,7 +1324,6 @@ async def transcribe_meeting(
         raise
     except Exception as e:
         print(f"[Transcribe] Unexpected error in transcribe_meeting: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1403,16 +1393,11 @@ async def refine_speaker_diarization(
     Refine speaker diarization using all audio files for the meeting
     and update existing transcriptions with improved speaker labels
     """
-    import asyncio
-    
     try:
         print(f"[SpeakerRefinement] Starting speaker refinement for meeting {meeting_id}")
         
         # Verify the meeting exists and belongs to the current user
-        meeting = db.query(models.Meeting).filter(
-            models.Meeting.id == meeting_id,
-            models.Meeting.owner_id == current_user.id
-        ).first()
+        meeting = crud.get_owned_meeting(db, meeting_id, current_user.id)
         
         if not meeting:
             raise HTTPException(
@@ -1422,7 +1407,7 @@ async def refine_speaker_diarization(
         
         # Get all audio files for this meeting
         print(f"[SpeakerRefinement] Getting audio files for meeting {meeting_id}")
-        audio_files = get_meeting_audio_files(meeting_id, current_user.email)
+        audio_files = await get_meeting_audio_files_async(meeting_id, current_user.email)
         if not audio_files:
             # Enhanced debugging for missing audio files
             safe_email = get_safe_email_for_path(current_user.email)
@@ -1436,43 +1421,18 @@ async def refine_speaker_diarization(
             else:
                 print(f"[SpeakerRefinement] Directory doesn't exist")
             
-            # Check for transcriptions without audio files (fallback mode)
-            transcriptions = db.query(models.Transcription).filter(
-                models.Transcription.meeting_id == meeting_id
-            ).order_by(models.Transcription.timestamp).all()
+            # Check for transcriptions without audio files (fallback mode); the
+            # consistent relabel runs as one UPDATE per distinct speaker
+            speaker_mapping, updated_count, transcription_count = relabel_speakers_consistently(db, meeting_id)
             
-            if transcriptions:
-                print(f"[SpeakerRefinement] Found {len(transcriptions)} transcriptions without audio files - using fallback mode")
-                
-                # Simple speaker consistency fix without audio
-                updated_count = 0
-                speaker_mapping = {}
-                next_speaker_id = 1
-                
-                for transcription in transcriptions:
-                    current_speaker = transcription.speaker or "Unknown"
-                    
-                    if current_speaker not in speaker_mapping:
-                        if current_speaker == "Unknown" or current_speaker.startswith("SPEAKER_"):
-                            speaker_mapping[current_speaker] = f"Speaker_{next_speaker_id}"
-                            next_speaker_id += 1
-                        else:
-                            speaker_mapping[current_speaker] = current_speaker
-                    
-                    new_speaker = speaker_mapping[current_speaker]
-                    
-                    if transcription.speaker != new_speaker:
-                        transcription.speaker = new_speaker
-                        updated_count += 1
-                
-                if updated_count > 0:
-                    db.commit()
+            if transcription_count:
+                print(f"[SpeakerRefinement] Found {transcription_count} transcriptions without audio files - using fallback mode")
                 
                 return {
                     "message": "Speaker refinement completed in fallback mode (no audio files found)",
                     "audio_files_processed": 0,
                     "transcriptions_updated": updated_count,
-                    "refined_segments": len(transcriptions),
+                    "refined_segments": transcription_count,
                     "speaker_mapping": speaker_mapping,
                     "mode": "fallback_without_audio",
                     "debug_info": {
@@ -1502,10 +1462,16 @@ async def refine_speaker_diarization(
         print(f"[SpeakerRefinement] Using simplified speaker refinement approach...")
         
         try:
-            # Get existing transcriptions
-            transcriptions = db.query(models.Transcription).filter(
+            # Read the transcriptions once (only the columns grouping needs); the
+            # relabelled speakers are carried into the grouped rows below
+            transcriptions = db.query(
+                models.Transcription.id,
+                models.Transcription.speaker,
+                models.Transcription.text,
+                models.Transcription.timestamp
+            ).filter(
                 models.Transcription.meeting_id == meeting_id
-            ).order_by(models.Transcription.timestamp).all()
+            ).order_by(models.Transcription.timestamp, models.Transcription.id).all()
             
             if not transcriptions:
                 print(f"[SpeakerRefinement] No transcriptions found for meeting {meeting_id}")
@@ -1516,58 +1482,35 @@ async def refine_speaker_diarization(
                     "refined_segments": 0
                 }
             
-            # Simple speaker refinement: assign consistent speaker IDs based on existing patterns
-            updated_count = 0
-            speaker_mapping = {}
-            next_speaker_id = 1
-            
-            print(f"[SpeakerRefinement] Processing {len(transcriptions)} transcriptions...")
-            
-            for transcription in transcriptions:
-                current_speaker = transcription.speaker or "Unknown"
-                
-                # Create consistent speaker mapping
-                if current_speaker not in speaker_mapping:
-                    if current_speaker == "Unknown" or current_speaker.startswith("SPEAKER_"):
-                        speaker_mapping[current_speaker] = f"Speaker_{next_speaker_id}"
-                        next_speaker_id += 1
-                    else:
-                        speaker_mapping[current_speaker] = current_speaker
-                
-                new_speaker = speaker_mapping[current_speaker]
-                
-                # Update if different
-                if transcription.speaker != new_speaker:
-                    transcription.speaker = new_speaker
-                    updated_count += 1
-            
-            # Commit all changes
-            if updated_count > 0:
-                db.commit()
-                print(f"[SpeakerRefinement] Updated {updated_count} transcriptions with consistent speaker IDs")
-            else:
-                print(f"[SpeakerRefinement] No transcriptions needed updating")
+            # Simple speaker refinement: assign consistent speaker IDs based on existing patterns.
+            # Counter tallies the speakers at C level and keeps first-appearance order, so
+            # the mapping and the update count only loop over the distinct speakers
+            speaker_counts = Counter(map(attrgetter("speaker"), transcriptions))
+            speaker_mapping = consistent_speaker_mapping(speaker_counts)
+            updated_count = sum(
+                count for speaker, count in speaker_counts.items()
+                if speaker != speaker_mapping[speaker or "Unknown"]
+            )
+            print(f"[SpeakerRefinement] {updated_count} of {len(transcriptions)} transcriptions get consistent speaker IDs")
             
             # Apply consecutive speaker phrase grouping optimization
             print(f"[SpeakerRefinement] Applying consecutive speaker phrase grouping...")
             
-            # Get updated transcriptions (after speaker refinement)
-            updated_transcriptions = db.query(models.Transcription).filter(
-                models.Transcription.meeting_id == meeting_id
-            ).order_by(models.Transcription.timestamp).all()
-            
-            # Group consecutive phrases from the same speaker
-            grouped_transcriptions = group_consecutive_speaker_phrases(updated_transcriptions)
+            # Group consecutive phrases from the same (relabelled) speaker
+            grouped_transcriptions = group_consecutive_speaker_phrases(transcriptions, speaker_mapping)
             
-            print(f"[SpeakerRefinement] Grouped {len(updated_transcriptions)} transcriptions into {len(grouped_transcriptions)} speaker segments")
+            print(f"[SpeakerRefinement] Grouped {len(transcriptions)} transcriptions into {len(grouped_transcriptions)} speaker segments")
             
-            # Apply grouped transcriptions to database
+            # Grouping replaces every row of the meeting, so the new labels land with it;
+            # only when nothing is grouped do the existing rows need relabelling in place
             if grouped_transcriptions:
                 grouped_count = apply_grouped_transcriptions_to_db(db, meeting_id, grouped_transcriptions)
                 print(f"[SpeakerRefinement] Successfully applied {grouped_count} grouped transcriptions")
             else:
                 print(f"[SpeakerRefinement] No grouped transcriptions to apply")
                 grouped_count = 0
+                if updated_count > 0:
+                    relabel_transcription_rows(db, meeting_id, transcriptions, speaker_mapping)
             
             print(f"[SpeakerRefinement] Simplified speaker refinement completed successfully")
             return {
@@ -1591,22 +1534,123 @@ async def refine_speaker_diarization(
         raise
     except Exception as e:
         print(f"[SpeakerRefinement] Error in speaker refinement: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Speaker refinement failed: {str(e)}"
         )
 
+# Upper bound on chunker chunks merged into one speaker-identifier call; 4 x 5s
+# chunks stays inside Whisper's 30s window
+STREAM_MAX_COALESCED_CHUNKS = 4
+
+def coalesce_audio_chunks(chunks: List[tuple], max_chunks: int = STREAM_MAX_COALESCED_CHUNKS) -> List[tuple]:
+    """
+    Join consecutive (audio, start, end) chunks into groups of up to max_chunks. A group
+    starts where its first chunk does and lasts as long as its chunks' audio combined
+    """
+    coalesced = []
+    for i in range(0, len(chunks), max_chunks):
+        group = chunks[i:i + max_chunks]
+        if len(group) == 1:
+            coalesced.append(group[0])
+            continue
+        duration = sum(end - start for _, start, end in group)
+        group_start = group[0][1]
+        coalesced.append((np.concatenate([audio for audio, _, _ in group]), group_start, group_start + duration))
+    return coalesced
+
+def merge_speaker_runs(
+    pending_segment: Optional[dict],
+    pending_speaker_id: Optional[int],
+    segments: List[dict],
+    speaker_ids: Dict[str, int],
+    time_tolerance: float
+):
+    """
+    Merge consecutive segments from the same speaker separated by at most
+    time_tolerance seconds. pending_segment, the open run from the previous chunk,
+    leads the rows. Returns (finalized_segments, open_segment, open_speaker_id)
+    """
+    if not segments:
+        return [], pending_segment, pending_speaker_id
+    
+    rows = segments if pending_segment is None else [pending_segment, *segments]
+    # Labels are only needed when saving/sending; runs are found on small int ids
+    speaker_codes = [] if pending_segment is None else [pending_speaker_id]
+    for segment in segments:
+        speaker_id = speaker_ids.get(segment["speaker"])
+        if speaker_id is None:
+            speaker_id = speaker_ids[segment["speaker"]] = len(speaker_ids)
+        speaker_codes.append(speaker_id)
+    
+    speakers = np.array(speaker_codes)
+    starts = np.array([row["start_time"] for row in rows], dtype=np.float64)
+    ends = np.array([row["end_time"] for row in rows], dtype=np.float64)
+    # A run breaks on a speaker change or a gap wider than the tolerance
+    breaks = (speakers[1:] != speakers[:-1]) | ~(starts[1:] - ends[:-1] <= time_tolerance)
+    boundaries = [0, *(np.flatnonzero(breaks) + 1).tolist(), len(rows)]
+    
+    merged = []
+    for run_start, run_end in zip(boundaries[:-1], boundaries[1:]):
+        if run_end - run_start == 1:
+            merged.append(rows[run_start])
+        else:
+            merged.append({
+                **rows[run_start],
+                "text": " ".join(row["text"] for row in rows[run_start:run_end]),
+                "end_time": rows[run_end - 1]["end_time"]
+            })
+    return merged[:-1], merged[-1], speaker_codes[boundaries[-2]]
+
+# Every transcription frame shares this envelope, so only the segment list and
+# the two times are encoded per send
+_TRANSCRIPTION_FRAME_PREFIX = '{"type":"transcription","data":{"segments":'
+
+def encode_transcription_frame(segments: List[dict]) -> str:
+    """Encode a transcription WebSocket frame around the cached envelope prefix"""
+    if ORJSON_AVAILABLE:
+        encoded_segments = orjson.dumps(segments, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    else:
+        encoded_segments = json.dumps(segments)
+    start_time = float(min(segment["start_time"] for segment in segments))
+    end_time = float(max(segment["end_time"] for segment in segments))
+    return f'{_TRANSCRIPTION_FRAME_PREFIX}{encoded_segments},"start_time":{start_time!r},"end_time":{end_time!r}}}}}'
+
+def save_streamed_transcriptions(meeting_id: int, segments: List[dict]) -> None:
+    """Insert a batch of streamed segments with its own session; runs in a worker thread"""
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(models.Transcription, [
+            {
+                "meeting_id": meeting_id,
+                "speaker": segment["speaker"],
+                "text": segment["text"]
+            }
+            for segment in segments
+        ])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 @app.websocket("/ws/meetings/{meeting_id}/stream")
 async def stream_audio(
     websocket: WebSocket,
     meeting_id: int,
     db: Session = Depends(get_db)
 ):
+    # Read the setting once: every per-chunk diagnostic below is skipped when off
+    show_logs = settings.SHOW_BACKEND_LOGS
     chunker = AudioChunker()
     speaker_identifier = None
+    audio_consumer_task = None
+    transcription_writer_task = None
     last_processed_segment = None # Variable to hold the last processed segment for merging
+    last_processed_speaker_id = None # Interned speaker id of last_processed_segment
+    speaker_ids = {} # Speaker label -> small int id, assigned on first sight
     time_tolerance = 0.1 # seconds - Tolerance for merging consecutive segments
 
     try:
@@ -1627,7 +1671,7 @@ async def stream_audio(
             
         # Verify token
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            payload = decode_ws_token(token)
             email = payload.get("sub")
             if not email:
                 await websocket.close(code=1008, reason="Invalid token: no email")
@@ -1648,13 +1692,13 @@ async def stream_audio(
             await websocket.close(code=1008, reason="Invalid or expired token")
             return
 
-        if settings.SHOW_BACKEND_LOGS:
+        if show_logs:
             print(f"WebSocket connected and authenticated for meeting {meeting_id}")
 
         # Initialize speaker identifier after authentication
         try:
             speaker_identifier = create_speaker_identifier()
-            if settings.SHOW_BACKEND_LOGS:
+            if show_logs:
                 print("Speaker identifier initialized")
         except Exception as init_error:
             print(f"Error initializing speaker identifier: {init_error}")
@@ -1663,46 +1707,61 @@ async def stream_audio(
 
         meeting_audio_time = 0.0  # Track total audio time since meeting start
 
-        # Process incoming raw audio data (Float32Array bytes)
-        while True:
-            data = await websocket.receive_bytes()
-
-            if isinstance(data, bytes):
-                try:
-                    buffer_size_before = len(chunker.buffer)
-                    if settings.SHOW_BACKEND_LOGS:
-                        print(f"[WebSocket] Received audio chunk: {len(data)} bytes. Chunker buffer size before: {buffer_size_before}")
-                    recv_time = time.time()
-
-                    if len(data) % 4 != 0:
-                         if settings.SHOW_BACKEND_LOGS:
-                             print(f"Warning: Received byte data length ({len(data)}) is not a multiple of 4. Skipping processing for this chunk.")
-                         continue
+        # Bounded hand-off between the receive loop and speaker processing so a slow
+        # chunk never stalls receive_bytes; when full the oldest chunk is dropped
+        audio_queue = asyncio.Queue(maxsize=8)
 
-                    audio_chunk = np.frombuffer(data, dtype=np.float32)
-                    if settings.SHOW_BACKEND_LOGS:
-                        print(f"[WebSocket] Audio chunk shape: {audio_chunk.shape}, dtype: {audio_chunk.dtype}")
+        # Finalized segments are persisted by a separate task so database commits
+        # overlap with processing of the next audio chunk
+        transcription_write_queue = asyncio.Queue(maxsize=32)
 
-                    # Process the audio chunk with the chunker and then the speaker identifier
-                    async for processed_chunk, chunk_start_time, chunk_end_time in chunker.process_audio_stream([audio_chunk]):
+        async def persist_transcriptions():
+            while True:
+                segments = await transcription_write_queue.get()
+                if segments is None:  # Sentinel queued once the stream is finished
+                    break
+                try:
+                    await asyncio.to_thread(save_streamed_transcriptions, meeting_id, segments)
+                    if show_logs:
+                        print(f"[WebSocket] Saved {len(segments)} transcriptions to database")
+                except Exception as e:
+                    print(f"[WebSocket] Error saving transcriptions to database: {e}")
+
+        async def process_audio_queue():
+            nonlocal last_processed_segment, last_processed_speaker_id, meeting_audio_time
+            while True:
+                item = await audio_queue.get()
+                if item is None:  # Sentinel queued on disconnect
+                    break
+                audio_chunk, recv_time = item
+                # Take any backlog in one go so its chunks reach the model as one super-chunk
+                received_chunks = [audio_chunk]
+                stop_after_batch = False
+                while not audio_queue.empty():
+                    queued = audio_queue.get_nowait()
+                    if queued is None:
+                        stop_after_batch = True
+                        break
+                    received_chunks.append(queued[0])
+                try:
+                    # Process the audio with the chunker and then the speaker identifier
+                    ready_chunks = [chunk for received_chunk in received_chunks for chunk in chunker.feed(received_chunk)]
+                    for processed_chunk, chunk_start_time, chunk_end_time in coalesce_audio_chunks(ready_chunks):
                          # Use meeting_audio_time as the absolute chunk start time
                          abs_chunk_start_time = meeting_audio_time
                          abs_chunk_end_time = abs_chunk_start_time + (chunk_end_time - chunk_start_time)
-                         process_start = time.time()
-                         if settings.SHOW_BACKEND_LOGS:
+                         if show_logs:
+                             process_start = time.time()
                              print(f"[WebSocket] Processing chunk: start={abs_chunk_start_time:.2f}s, end={abs_chunk_end_time:.2f}s, current_time={process_start}, delay={process_start - recv_time:.3f}s")
-                         buffer_size_after = len(chunker.buffer)
-                         if settings.SHOW_BACKEND_LOGS:
-                             print(f"[WebSocket] Chunker buffer size after: {buffer_size_after}")
+                             print(f"[WebSocket] Chunker buffer size after: {len(chunker.buffer)}")
 
                          # Process audio chunk with speaker identifier (with safety checks)
                          try:
                              # Verify speaker_identifier is still in a valid state
-                             if (speaker_identifier and 
-                                 hasattr(speaker_identifier, "__dict__") and 
-                                 hasattr(speaker_identifier, "process_audio_chunk")):
-                                 
-                                 newly_processed_segments = speaker_identifier.process_audio_chunk(
+                             if speaker_identifier is not None and speaker_identifier.ready:
+                                 # CPU-bound diarization/transcription runs off the event loop
+                                 newly_processed_segments = await asyncio.to_thread(
+                                     speaker_identifier.process_audio_chunk,
                                      processed_chunk,
                                      abs_chunk_start_time
                                  )
@@ -1716,174 +1775,139 @@ async def stream_audio(
                              print(f"[WebSocket] General speaker identifier error: {general_speaker_error}")
                              newly_processed_segments = []
                          
-                         process_end = time.time()
-                         if settings.SHOW_BACKEND_LOGS:
-                             print(f"[WebSocket] SpeakerIdentifier returned {len(newly_processed_segments)} segments. Processing time: {process_end - process_start:.3f}s")
-
-                         finalized_segments = []
-                         current_merged_segment = last_processed_segment
-
-                         for segment in newly_processed_segments:
-                              if current_merged_segment is None:
-                                   current_merged_segment = segment
-                              elif (segment["speaker"] == current_merged_segment["speaker"] and 
-                                    segment["start_time"] - current_merged_segment["end_time"] <= time_tolerance):
-                                   # Merge consecutive segments from the same speaker
-                                   current_merged_segment["text"] += " " + segment["text"]
-                                   current_merged_segment["end_time"] = segment["end_time"]
-                              else:
-                                   # Different speaker or time gap too large, finalize current segment
-                                   finalized_segments.append(current_merged_segment)
-                                   current_merged_segment = segment
-
-                         last_processed_segment = current_merged_segment
-
-                         if settings.SHOW_BACKEND_LOGS:
+                         if show_logs:
+                             print(f"[WebSocket] SpeakerIdentifier returned {len(newly_processed_segments)} segments. Processing time: {time.time() - process_start:.3f}s")
+
+                         # Merge consecutive same-speaker segments; the last run stays pending
+                         # because the next chunk may continue it
+                         finalized_segments, last_processed_segment, last_processed_speaker_id = merge_speaker_runs(
+                             last_processed_segment,
+                             last_processed_speaker_id,
+                             newly_processed_segments,
+                             speaker_ids,
+                             time_tolerance
+                         )
+
+                         if show_logs:
                              print(f"[WebSocket] Number of segments finalized in this chunk: {len(finalized_segments)}")
                          if finalized_segments:
-                              if settings.SHOW_BACKEND_LOGS:
-                                  print(f"[WebSocket] Sending {len(finalized_segments)} finalized segments via WebSocket.")
-                              for final_segment in finalized_segments:
-                                   if settings.SHOW_BACKEND_LOGS:
-                                       print(f"[WebSocket] Sending segment: {final_segment}")
-                                   
-                                   # Save transcription to database
-                                   try:
-                                       transcription = models.Transcription(
-                                           meeting_id=meeting_id,
-                                           speaker=final_segment["speaker"],
-                                           text=final_segment["text"],
-                                           timestamp=datetime.utcnow()
-                                       )
-                                       db.add(transcription)
-                                       db.commit()
-                                       if settings.SHOW_BACKEND_LOGS:
-                                           print(f"[WebSocket] Saved transcription to database: {transcription.id}")
-                                   except Exception as e:
-                                       if settings.SHOW_BACKEND_LOGS:
-                                           print(f"[WebSocket] Error saving transcription to database: {e}")
-                                       db.rollback()
-                                   
-                                   await websocket.send_json({
-                                       "type": "transcription",
-                                       "data": {
-                                           "segments": [final_segment],
-                                           "start_time": final_segment["start_time"],
-                                           "end_time": final_segment["end_time"]
-                                       }
-                                   })
-                              if settings.SHOW_BACKEND_LOGS:
+                              # Hand the chunk's transcriptions to the writer task (one INSERT batch and one commit)
+                              await transcription_write_queue.put(finalized_segments)
+
+                              # One frame per chunk carrying every finalized segment; the client
+                              # already iterates data.segments
+                              if show_logs:
+                                  print(f"[WebSocket] Sending {len(finalized_segments)} finalized segments via WebSocket: {finalized_segments}")
+                              await websocket.send_text(encode_transcription_frame(finalized_segments))
+                              if show_logs:
                                   print("[WebSocket] Finished sending finalized segments for this chunk.")
 
-                         if settings.SHOW_BACKEND_LOGS:
+                         if show_logs:
                              print(f"[WebSocket] Pending last_processed_segment for next chunk: {last_processed_segment}")
 
                          # Increment meeting_audio_time by the chunk duration
                          meeting_audio_time += (chunk_end_time - chunk_start_time)
 
                 except Exception as e:
-                    if settings.SHOW_BACKEND_LOGS:
-                        print(f"[WebSocket] Error processing received raw audio data: {e}")
+                    if show_logs:
+                        print(f"[WebSocket] Error processing queued audio chunk: {e}")
+                if stop_after_batch:
+                    break
+
+        audio_consumer_task = asyncio.create_task(process_audio_queue())
+        transcription_writer_task = asyncio.create_task(persist_transcriptions())
 
-            # Handle other data types if necessary
-            # elif isinstance(data, str):
-            #    print(f"Received text message: {data}")
+        # Process incoming raw audio data (Float32Array bytes)
+        while True:
+            # receive_bytes already guarantees bytes (or raises), so no type check here
+            data = await websocket.receive_bytes()
+
+            try:
+                n = len(data)
+                # Receive timestamps only feed the delay diagnostics
+                recv_time = 0.0
+                if show_logs:
+                    recv_time = time.time()
+                    print(f"[WebSocket] Received audio chunk: {n} bytes. Queue size: {audio_queue.qsize()}")
+
+                # Float32 samples: byte length must be a multiple of 4
+                if n & 3:
+                    if show_logs:
+                        print(f"Warning: Received byte data length ({n}) is not a multiple of 4. Skipping processing for this chunk.")
+                    continue
+
+                audio_chunk = np.frombuffer(data, dtype=np.float32, count=n >> 2)
+                if show_logs:
+                    print(f"[WebSocket] Audio chunk shape: {audio_chunk.shape}, dtype: {audio_chunk.dtype}")
+
+                try:
+                    audio_queue.put_nowait((audio_chunk, recv_time))
+                except asyncio.QueueFull:
+                    # Drop the oldest chunk to keep up with the live stream
+                    audio_queue.get_nowait()
+                    audio_queue.put_nowait((audio_chunk, recv_time))
+                    if show_logs:
+                        print("[WebSocket] Audio queue full, dropped oldest chunk")
+
+            except Exception as e:
+                if show_logs:
+                    print(f"[WebSocket] Error processing received raw audio data: {e}")
 
     except WebSocketDisconnect:
         print(f"WebSocket disconnected from meeting {meeting_id}")
+        # Let the consumer finish any chunks still queued before flushing state
+        if audio_consumer_task is not None:
+            try:
+                await audio_queue.put(None)
+                await audio_consumer_task
+            except Exception as e:
+                print(f"[WebSocket] Error draining audio queue on disconnect: {e}")
         # If there's a pending last_processed_segment when disconnecting, send it
         if last_processed_segment is not None:
-            if settings.SHOW_BACKEND_LOGS:
+            if show_logs:
                 print("Sending final pending segment on disconnect.")
             
             # Save final transcription to database
+            await transcription_write_queue.put([last_processed_segment])
+
             try:
-                transcription = models.Transcription(
-                    meeting_id=meeting_id,
-                    speaker=last_processed_segment["speaker"],
-                    text=last_processed_segment["text"],
-                    timestamp=datetime.utcnow()
-                )
-                db.add(transcription)
-                db.commit()
-                if settings.SHOW_BACKEND_LOGS:
-                    print(f"[WebSocket] Saved final transcription to database: {transcription.id}")
-            except Exception as e:
-                if settings.SHOW_BACKEND_LOGS:
-                    print(f"[WebSocket] Error saving final transcription to database: {e}")
-                db.rollback()
-            
-            try:
-                await websocket.send_json({
-                    "type": "transcription",
-                    "data": {
-                        "segments": [last_processed_segment],
-                        "start_time": last_processed_segment["start_time"],
-                        "end_time": last_processed_segment["end_time"]
-                    }
-                })
+                await websocket.send_text(encode_transcription_frame([last_processed_segment]))
             except Exception as e:
                 print(f"Error sending final segment on disconnect: {e}")
         
         # Process and send any remaining buffered audio in speaker_identifier
-        if speaker_identifier:
+        if speaker_identifier is not None:
             try:
-                # More comprehensive safety checks to prevent introspection errors
-                if (hasattr(speaker_identifier, "__dict__") and 
-                    hasattr(speaker_identifier, "audio_buffer") and 
-                    hasattr(speaker_identifier, "buffer_start_time")):
-                    
+                if speaker_identifier.ready:
                     # Additional check to ensure the object is in a valid state
                     try:
                         buffer_length = len(speaker_identifier.audio_buffer)
                         if buffer_length > 0:
-                            if settings.SHOW_BACKEND_LOGS:
+                            if show_logs:
                                 print("Processing remaining audio buffer on disconnect.")
-                            remaining_segments = speaker_identifier.process_audio_chunk(
+                            remaining_segments = await asyncio.to_thread(
+                                speaker_identifier.process_audio_chunk,
                                 speaker_identifier.audio_buffer,
                                 speaker_identifier.buffer_start_time
                             )
                             if remaining_segments:
-                                for segment in remaining_segments:
-                                    # Save remaining transcription to database
-                                    try:
-                                        transcription = models.Transcription(
-                                            meeting_id=meeting_id,
-                                            speaker=segment["speaker"],
-                                            text=segment["text"],
-                                            timestamp=datetime.utcnow()
-                                        )
-                                        db.add(transcription)
-                                        db.commit()
-                                        if settings.SHOW_BACKEND_LOGS:
-                                            print(f"[WebSocket] Saved remaining transcription to database: {transcription.id}")
-                                    except Exception as e:
-                                        if settings.SHOW_BACKEND_LOGS:
-                                            print(f"[WebSocket] Error saving remaining transcription to database: {e}")
-                                        db.rollback()
-                                    
-                                    try:
-                                        await websocket.send_json({
-                                            "type": "transcription",
-                                            "data": {
-                                                "segments": [segment],
-                                                "start_time": segment["start_time"],
-                                                "end_time": segment["end_time"]
-                                            }
-                                        })
-                                    except Exception as e:
-                                        print(f"Error sending remaining segment on disconnect: {e}")
+                                # Save remaining transcriptions with one INSERT batch and one commit
+                                await transcription_write_queue.put(remaining_segments)
+
+                                try:
+                                    await websocket.send_text(encode_transcription_frame(remaining_segments))
+                                except Exception as e:
+                                    print(f"Error sending remaining segments on disconnect: {e}")
                             
                             # Clear the buffer after processing
                             try:
-                                if hasattr(speaker_identifier, "audio_buffer"):
-                                    speaker_identifier.audio_buffer = np.array([], dtype=np.float32)
+                                speaker_identifier.audio_buffer = np.array([], dtype=np.float32)
                             except Exception as clear_error:
                                 print(f"Error clearing audio buffer: {clear_error}")
                     except (AttributeError, TypeError, RuntimeError) as attr_error:
                         print(f"[WebSocket] Speaker identifier object in invalid state during cleanup: {attr_error}")
                 else:
-                    print("[WebSocket] Speaker identifier missing required attributes, skipping buffer processing")
+                    print("[WebSocket] Speaker identifier not ready, skipping buffer processing")
             except Exception as e:
                 print(f"[WebSocket] Error during speaker identifier cleanup: {e}")
                 # Don't re-raise, just log and continue cleanup
@@ -1895,52 +1919,34 @@ async def stream_audio(
         except Exception as close_error:
             print(f"Error closing WebSocket: {close_error}")
     finally:
+        if audio_consumer_task is not None and not audio_consumer_task.done():
+            audio_consumer_task.cancel()
+
+        # Flush every queued transcription batch before the connection is torn down
+        if transcription_writer_task is not None and not transcription_writer_task.done():
+            try:
+                await transcription_write_queue.put(None)
+                await transcription_writer_task
+            except Exception as e:
+                print(f"[WebSocket] Error flushing transcription writes: {e}")
+
         try:
             # Cleanup chunker
             if chunker and hasattr(chunker, 'cleanup'):
                 chunker.cleanup()
-                if settings.SHOW_BACKEND_LOGS:
+                if show_logs:
                     print("Cleaned up chunker resources")
         except Exception as cleanup_error:
-            if settings.SHOW_BACKEND_LOGS:
+            if show_logs:
                 print(f"Error during chunker cleanup: {cleanup_error}")
         
         try:
-            # Cleanup speaker_identifier with comprehensive error handling
-            if speaker_identifier:
+            # Release the speaker identifier's models and buffered audio
+            if speaker_identifier is not None:
                 try:
-                    # Check if the object is in a valid state before cleanup
-                    if hasattr(speaker_identifier, "__dict__"):
-                        # Try to access a simple attribute to test object validity
-                        _ = getattr(speaker_identifier, "sample_rate", None)
-                        
-                        # If we get here, the object seems valid, try cleanup
-                        if hasattr(speaker_identifier, "audio_buffer"):
-                            try:
-                                speaker_identifier.audio_buffer = np.array([], dtype=np.float32)
-                            except Exception:
-                                pass  # Ignore cleanup errors
-                        
-                        # Try to cleanup any PyTorch/CUDA resources
-                        if hasattr(speaker_identifier, "pipeline"):
-                            try:
-                                del speaker_identifier.pipeline
-                            except Exception:
-                                pass
-                        
-                        if hasattr(speaker_identifier, "whisper_model"):
-                            try:
-                                del speaker_identifier.whisper_model
-                            except Exception:
-                                pass
-                        
-                        if settings.SHOW_BACKEND_LOGS:
-                            print("Cleaned up speaker identifier resources")
-                    else:
-                        print("Speaker identifier object in invalid state, skipping cleanup")
-                        
-                except (AttributeError, TypeError, RuntimeError) as introspection_error:
-                    print(f"Introspection error during speaker identifier cleanup: {introspection_error}")
+                    speaker_identifier.cleanup()
+                    if show_logs:
+                        print("Cleaned up speaker identifier resources")
                 except Exception as general_cleanup_error:
                     print(f"General error during speaker identifier cleanup: {general_cleanup_error}")
         except Exception as final_cleanup_error:
@@ -1948,7 +1954,6 @@ async def stream_audio(
         
         # Force garbage collection to help with memory cleanup
         try:
-            import gc
             gc.collect()
         except Exception:
             pass
@@ -1969,12 +1974,7 @@ def get_meeting_summaries(
     current_user: models.User = Depends(get_current_user)
 ):
     # Verify the meeting exists and belongs to the current user
-    meeting = db.query(models.Meeting).filter(
-        models.Meeting.id == meeting_id,
-        models.Meeting.owner_id == current_user.id
-    ).first()
-    
-    if not meeting:
+    if not crud.owns_meeting(db, meeting_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meeting not found"
@@ -1993,12 +1993,7 @@ def get_meeting_notes_endpoint(
     current_user: models.User = Depends(get_current_user)
 ):
     # Verify the meeting exists and belongs to the current user
-    meeting = db.query(models.Meeting).filter(
-        models.Meeting.id == meeting_id,
-        models.Meeting.owner_id == current_user.id
-    ).first()
-    
-    if not meeting:
+    if not crud.owns_meeting(db, meeting_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meeting not found"
@@ -2055,35 +2050,44 @@ def end_meeting_endpoint(
 @limiter.limit("10/minute")  # AI processing intensive
 async def get_meeting_summary(
     request: Request,
+    response: Response,
     meeting_id: int, 
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    # Verify the meeting exists and belongs to the current user
-    meeting = db.query(models.Meeting).filter(
-        models.Meeting.id == meeting_id,
-        models.Meeting.owner_id == current_user.id
-    ).first()
+    # Verify the meeting exists and belongs to the current user, fetching any stored
+    # summary and meeting notes in the same round trip
+    meeting_row = crud.get_meeting_with_latest_summary_and_notes(db, meeting_id, current_user.id)
     
-    if not meeting:
+    if not meeting_row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meeting not found"
         )
     
-    # Check if there's already a stored summary
-    stored_summary = crud.get_latest_meeting_summary(db, meeting_id)
-    stored_meeting_notes = crud.get_latest_meeting_notes(db, meeting_id)
+    meeting, stored_summary_content, stored_meeting_notes_content = meeting_row
     
-    if stored_summary and stored_meeting_notes:
+    if stored_summary_content is not None and stored_meeting_notes_content is not None:
+        # The response is a function of the stored pair, so the client's copy is current
+        # when its ETag matches
+        etag = stored_summary_etag(stored_summary_content, stored_meeting_notes_content)
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        
+        # Stored rows are immutable, so an unchanged summary/notes pair skips re-parsing
+        cached_response = _stored_summary_responses.get(etag)
+        if cached_response is not None:
+            response.headers["ETag"] = etag
+            return dict(cached_response)
+        
         try:
             # Try to parse as JSON (new structured format)
-            parsed_content = json.loads(stored_summary.content)
+            parsed_content = loads_json(stored_summary_content)
             if isinstance(parsed_content, dict) and ("summary" in parsed_content or "meeting_notes" in parsed_content):
                 # Use stored meeting notes content
                 response_data = {
-                    "summary": parsed_content.get("summary", stored_summary.content),
-                    "meeting_notes": stored_meeting_notes.content,
+                    "summary": parsed_content.get("summary", stored_summary_content),
+                    "meeting_notes": stored_meeting_notes_content,
                     "action_items": parsed_content.get("action_items", "No action items identified.")
                 }
                 
@@ -2098,30 +2102,34 @@ async def get_meeting_summary(
                     
                     # Update the stored summary with new action items
                     parsed_content["action_items"] = chatgpt_action_items
+                    stored_summary_content = dumps_json(parsed_content)
                     summary_create = schemas.SummaryCreate(
                         meeting_id=meeting_id,
-                        content=json.dumps(parsed_content)
+                        content=stored_summary_content
                     )
                     crud.create_summary(db, summary_create)
-                
-                return response_data
+                    etag = stored_summary_etag(stored_summary_content, stored_meeting_notes_content)
             else:
                 # Legacy format - return as summary only
-                return {
-                    "summary": stored_summary.content,
-                    "meeting_notes": stored_meeting_notes.content if stored_meeting_notes else "No structured meeting notes available.",
+                response_data = {
+                    "summary": stored_summary_content,
+                    "meeting_notes": stored_meeting_notes_content,
                     "action_items": "No action items identified."
                 }
         except (json.JSONDecodeError, TypeError):
             # Legacy format - return as summary only
-            return {
-                "summary": stored_summary.content,
-                "meeting_notes": stored_meeting_notes.content if stored_meeting_notes else "No structured meeting notes available.",
+            response_data = {
+                "summary": stored_summary_content,
+                "meeting_notes": stored_meeting_notes_content,
                 "action_items": "No action items identified."
             }
+        
+        remember_stored_summary_response(etag, response_data)
+        response.headers["ETag"] = etag
+        return dict(response_data)
     
     # If no stored summary, generate a new one
-    audio_files = get_meeting_audio_files(meeting_id, current_user.email)
+    audio_files = await get_meeting_audio_files_async(meeting_id, current_user.email)
     if not audio_files:
         # Enhanced debugging for missing audio files
         safe_email = get_safe_email_for_path(current_user.email)
@@ -2138,7 +2146,7 @@ async def get_meeting_summary(
         # Check for existing transcriptions (fallback mode)
         transcriptions = db.query(models.Transcription).filter(
             models.Transcription.meeting_id == meeting_id
-        ).order_by(models.Transcription.timestamp).all()
+        ).order_by(models.Transcription.timestamp, models.Transcription.id).all()
         
         if transcriptions:
             print(f"[Summary] Found {len(transcriptions)} transcriptions without audio files - using fallback mode")
@@ -2180,21 +2188,27 @@ async def get_meeting_summary(
         # First, process any uploaded audio files that haven't been transcribed yet
         await process_uploaded_audio_files(meeting_id, audio_files, db)
         
+        # Load the transcript once for the OpenAI summary, action items and tags
+        transcript = load_meeting_transcript(db, meeting_id)
+        
         # Check if Gemini API key is available
         if GEMINI_API_KEY and GEMINI_API_KEY != "your-gemini-api-key-here":
             # Generate summary and meeting notes with Gemini
-            structured_content = summarize_with_gemini_multiple_files(audio_files)
+            summary_coroutine = summarize_with_gemini_multiple_files(audio_files)
         else:
             print("[Summary] Gemini API key not configured, using OpenAI for summary generation")
             # Fallback to OpenAI for summary generation
-            structured_content = await generate_summary_with_openai(meeting_id, db)
-        
-        # Generate action items with ChatGPT
-        chatgpt_action_items = await generate_action_items_with_chatgpt(meeting_id, db)
+            summary_coroutine = generate_summary_with_openai(meeting_id, db, transcript)
+        
+        # Summary, action items and tags are independent LLM requests, so they run
+        # concurrently; everything that writes their results waits for all three
+        structured_content, chatgpt_action_items, generated_tags = await asyncio.gather(
+            summary_coroutine,
+            generate_action_items_with_chatgpt(meeting_id, db, transcript),
+            generate_tags_with_chatgpt(meeting_id, db, transcript)
+        )
         structured_content["action_items"] = chatgpt_action_items
         
-        # Generate tags with ChatGPT
-        generated_tags = await generate_tags_with_chatgpt(meeting_id, db)
         if generated_tags:
             # Add tags to the meeting
             crud.add_tags_to_meeting(db, meeting_id, generated_tags, current_user.id)
@@ -2203,7 +2217,7 @@ async def get_meeting_summary(
         # Save the summary to database as JSON
         summary_create = schemas.SummaryCreate(
             meeting_id=meeting_id,
-            content=json.dumps({
+            content=dumps_json({
                 "summary": structured_content["summary"],
                 "action_items": structured_content["action_items"]
             })
@@ -2225,7 +2239,7 @@ async def get_meeting_summary(
         # Clean up audio files after successful summarization (if enabled)
         if settings.AUTO_CLEANUP_AUDIO_FILES:
             try:
-                cleanup_stats = cleanup_meeting_audio_files(meeting_id, current_user.email)
+                cleanup_stats = await asyncio.to_thread(cleanup_meeting_audio_files, meeting_id, current_user.email)
                 print(f"[Summary] Audio cleanup completed: {cleanup_stats}")
                 
                 # Add cleanup info to the response for debugging/monitoring
@@ -2248,11 +2262,40 @@ async def get_meeting_summary(
             "error": f"Error generating summary: {str(e)}"
         }, status_code=500)
 
+def sniff_audio_container(header: bytes) -> Optional[str]:
+    """Identify an audio container from the first bytes of a file"""
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"\x1aE\xdf\xa3":  # EBML: WebM/Matroska
+        return "webm"
+    if header[:4] == b"OggS":
+        return "ogg"
+    if header[:4] == b"fLaC":
+        return "flac"
+    if header[4:8] == b"ftyp":  # ISO base media: m4a/mp4
+        return "mp4"
+    if header[:3] == b"ID3" or (len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):  # MP3/ADTS frame sync
+        return "mpeg"
+    return None
+
 def validate_and_fix_audio_file(file_path: str) -> bool:
     """
     Validate audio file and attempt to fix format issues
     Returns True if file is valid or was successfully fixed
     """
+    # A recognised container header is enough; the full FFmpeg decode below only runs
+    # for unknown headers or .wav files holding another container (which get converted)
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(16)
+        container = sniff_audio_container(header)
+        if (container is not None and os.path.getsize(file_path) > len(header) and
+                (container == "wav" or not file_path.lower().endswith(".wav"))):
+            return True
+    except OSError as e:
+        print(f"Audio file validation failed for {file_path}: {e}")
+        return False
+    
     try:
         # Try to load the file with pydub to check if it's valid
         audio_segment = AudioSegment.from_file(file_path)
@@ -2260,83 +2303,114 @@ def validate_and_fix_audio_file(file_path: str) -> bool:
     except Exception as e:
         print(f"Audio file validation failed for {file_path}: {e}")
         
-        # If it's a format issue, try to detect and fix
-        if "does not appear to be an audio format" in str(e) or "Format not recognised" in str(e):
+        # A sniffed EBML header marks a WebM recording saved under a .wav name; convert it
+        # whatever FFmpeg's error message says
+        if container == "webm" and file_path.lower().endswith(".wav"):
+            print(f"Detected WebM format in {file_path}, attempting conversion...")
+            
+            # Create backup
+            backup_path = file_path + ".backup"
             try:
-                # Try to read as raw bytes and see if we can detect the format
-                with open(file_path, 'rb') as f:
-                    header = f.read(12)
-                
-                # Check for WebM signature
-                if b'webm' in header.lower() or b'matroska' in header.lower():
-                    print(f"Detected WebM format in {file_path}, attempting conversion...")
-                    
-                    # Create backup
-                    backup_path = file_path + ".backup"
-                    os.rename(file_path, backup_path)
-                    
-                    try:
-                        # Convert WebM to WAV
-                        audio_segment = AudioSegment.from_file(backup_path, format="webm")
-                        audio_segment = audio_segment.set_channels(1).set_frame_rate(16000)
-                        audio_segment.export(file_path, format="wav")
-                        
-                        # Remove backup if successful
-                        os.remove(backup_path)
-                        print(f"Successfully converted {file_path} from WebM to WAV")
-                        return True
-                        
-                    except Exception as conv_e:
-                        # Restore backup if conversion failed
-                        os.rename(backup_path, file_path)
-                        print(f"Failed to convert {file_path}: {conv_e}")
-                        return False
-                        
-            except Exception as detect_e:
-                print(f"Failed to detect format for {file_path}: {detect_e}")
+                os.rename(file_path, backup_path)
+            except OSError as rename_e:
+                print(f"Failed to back up {file_path}: {rename_e}")
+                return False
+            
+            try:
+                # Convert WebM to WAV
+                audio_segment = AudioSegment.from_file(backup_path, format="webm")
+                audio_segment = audio_segment.set_channels(1).set_frame_rate(16000)
+                audio_segment.export(file_path, format="wav")
+                
+                # Remove backup if successful
+                os.remove(backup_path)
+                print(f"Successfully converted {file_path} from WebM to WAV")
+                return True
+                
+            except Exception as conv_e:
+                # Restore backup if conversion failed
+                os.rename(backup_path, file_path)
+                print(f"Failed to convert {file_path}: {conv_e}")
                 return False
         
         return False
 
-def get_meeting_audio_files(meeting_id: int, user_email: str) -> List[str]:
+# MIME types of the audio formats meetings are recorded/uploaded in; the keys are
+# also the extensions get_meeting_audio_files picks up from a meeting's directory
+AUDIO_MIME_TYPES = {
+    '.wav': 'audio/wav',
+    '.webm': 'audio/webm',
+    '.mp3': 'audio/mpeg',
+    '.m4a': 'audio/mp4',
+    '.flac': 'audio/flac',
+    '.ogg': 'audio/ogg',
+    '.aac': 'audio/aac'
+}
+AUDIO_FILE_EXTENSIONS = tuple(AUDIO_MIME_TYPES)
+
+# Validation results keyed by (path, mtime_ns, size), so files that haven't changed
+# since their last check are not decoded again
+_audio_validation_cache = {}
+_audio_validation_cache_lock = threading.Lock()  # Files are validated from worker threads
+AUDIO_VALIDATION_CACHE_MAX_ENTRIES = 4096
+
+def is_valid_audio_file(file_path: str, file_stat: Optional[os.stat_result] = None) -> bool:
+    """validate_and_fix_audio_file, reusing the result while the file is unchanged"""
+    if file_stat is None:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return False
+    cache_key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+    is_valid = _audio_validation_cache.get(cache_key)
+    if is_valid is not None:
+        return is_valid
+    
+    is_valid = validate_and_fix_audio_file(file_path)
+    if is_valid:
+        # A successful fix rewrites the file, so key the result on its new stat
+        try:
+            file_stat = os.stat(file_path)
+            cache_key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            return is_valid
+    with _audio_validation_cache_lock:
+        if len(_audio_validation_cache) >= AUDIO_VALIDATION_CACHE_MAX_ENTRIES:
+            _audio_validation_cache.pop(next(iter(_audio_validation_cache)))
+        _audio_validation_cache[cache_key] = is_valid
+    return is_valid
+
+def find_meeting_audio_files(meeting_id: int, user_email: str) -> Tuple[List[str], Dict[str, os.stat_result]]:
+    """Find (without validating) a meeting's audio files and the stats seen while listing them"""
     # Find all audio files for the given meeting_id and user
     safe_email = get_safe_email_for_path(user_email)
     user_meeting_dir = f"/tmp/meetings/{safe_email}/{meeting_id}"
     
-    # Check new location first with multiple patterns and extensions
-    patterns = [
-        f"{user_meeting_dir}/meeting_{meeting_id}_*.wav",
-        f"{user_meeting_dir}/meeting_{meeting_id}_*.webm",
-        f"{user_meeting_dir}/recording_*.wav",
-        f"{user_meeting_dir}/recording_*.webm",
-        f"{user_meeting_dir}/*.wav",
-        f"{user_meeting_dir}/*.webm",
-        f"{user_meeting_dir}/*.mp3",
-        f"{user_meeting_dir}/*.m4a",
-        f"{user_meeting_dir}/*.flac",
-        f"{user_meeting_dir}/*.ogg",
-        f"{user_meeting_dir}/*.aac"
-    ]
-    
-    files = []
-    for pattern in patterns:
-        files.extend(glob.glob(pattern))
-    
-    # Remove duplicates while preserving order
-    files = list(dict.fromkeys(files))
+    # Check new location first: one directory pass, reusing each entry's stat for the
+    # validation cache
+    file_stats = {}
+    try:
+        with os.scandir(user_meeting_dir) as entries:
+            for entry in entries:
+                if (not entry.name.startswith(".") and entry.name.endswith(AUDIO_FILE_EXTENSIONS)
+                        and entry.is_file()):
+                    file_stats[entry.path] = entry.stat()
+    except FileNotFoundError:
+        pass
+    files = list(file_stats)
     
     # If no files found in new location, check old location and migrate
     if not files:
-        old_patterns = [
-            f"/tmp/meeting_{meeting_id}_*.wav",
-            f"/tmp/meeting_{meeting_id}_*.webm",
-            f"/tmp/recording_{meeting_id}_*.wav",
-            f"/tmp/recording_{meeting_id}_*.webm"
-        ]
-        
+        old_prefixes = (f"meeting_{meeting_id}_", f"recording_{meeting_id}_")
         old_files = []
-        for pattern in old_patterns:
-            old_files.extend(glob.glob(pattern))
+        try:
+            with os.scandir("/tmp") as entries:
+                for entry in entries:
+                    if (entry.name.startswith(old_prefixes) and entry.name.endswith((".wav", ".webm"))
+                            and entry.is_file()):
+                        old_files.append(entry.path)
+        except FileNotFoundError:
+            pass
         
         if old_files:
             # Create new directory and migrate files
@@ -2355,10 +2429,60 @@ def get_meeting_audio_files(meeting_id: int, user_email: str) -> List[str]:
             
             files = migrated_files
     
-    # Validate and fix audio files
+    return files, file_stats
+
+# Full-content digests keyed by (path, mtime_ns, size), so unchanged files are hashed once
+_audio_content_hash_cache = {}
+_audio_content_hash_cache_lock = threading.Lock()
+AUDIO_CONTENT_HASH_CACHE_MAX_ENTRIES = 4096
+
+def get_audio_content_hash(file_path: str) -> Optional[str]:
+    """Digest of an audio file's full contents (BLAKE3 when installed), or None if unreadable"""
+    try:
+        file_stat = os.stat(file_path)
+        cache_key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        content_hash = _audio_content_hash_cache.get(cache_key)
+        if content_hash is not None:
+            return content_hash
+        
+        if file_stat.st_size == 0:
+            content = b""
+            content_hash = blake3.blake3(content).hexdigest() if BLAKE3_AVAILABLE else hashlib.blake2b(content).hexdigest()
+        else:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_audio:
+                if BLAKE3_AVAILABLE:
+                    content_hash = blake3.blake3(mapped_audio).hexdigest()
+                else:
+                    content_hash = hashlib.blake2b(mapped_audio).hexdigest()
+    except (OSError, ValueError) as e:
+        print(f"Could not hash audio file {file_path}: {e}")
+        return None
+    
+    with _audio_content_hash_cache_lock:
+        if len(_audio_content_hash_cache) >= AUDIO_CONTENT_HASH_CACHE_MAX_ENTRIES:
+            _audio_content_hash_cache.pop(next(iter(_audio_content_hash_cache)))
+        _audio_content_hash_cache[cache_key] = content_hash
+    return content_hash
+
+def drop_duplicate_audio_files(files: List[str], content_hashes: List[Optional[str]]) -> List[str]:
+    """Keep the first of each set of byte-identical files (e.g. a retried browser upload)"""
+    first_seen = {}
+    unique_files = []
+    for file_path, content_hash in zip(files, content_hashes):
+        if content_hash is None:
+            unique_files.append(file_path)
+        elif content_hash in first_seen:
+            print(f"Skipping duplicate audio file: {file_path} (same content as {first_seen[content_hash]})")
+        else:
+            first_seen[content_hash] = file_path
+            unique_files.append(file_path)
+    return unique_files
+
+def select_valid_audio_files(meeting_id: int, files: List[str], validity: List[bool]) -> List[str]:
+    """Keep the files whose validation passed, sorted by timestamp"""
     valid_files = []
-    for file_path in files:
-        if validate_and_fix_audio_file(file_path):
+    for file_path, is_valid in zip(files, validity):
+        if is_valid:
             valid_files.append(file_path)
         else:
             print(f"Skipping invalid audio file: {file_path}")
@@ -2368,47 +2492,227 @@ def get_meeting_audio_files(meeting_id: int, user_email: str) -> List[str]:
     print(f"[get_meeting_audio_files] Found {len(valid_files)} valid audio files for meeting {meeting_id}: {[os.path.basename(f) for f in valid_files]}")
     return valid_files
 
-def summarize_with_gemini_multiple_files(audio_files: List[str]) -> dict:
+def get_meeting_audio_files(meeting_id: int, user_email: str) -> List[str]:
+    """Find, validate and fix a meeting's audio files (for sync endpoints running in the threadpool)"""
+    files, file_stats = find_meeting_audio_files(meeting_id, user_email)
+    validity = [is_valid_audio_file(file_path, file_stats.get(file_path)) for file_path in files]
+    return select_valid_audio_files(meeting_id, files, validity)
+
+async def get_meeting_audio_files_async(meeting_id: int, user_email: str) -> List[str]:
+    """
+    get_meeting_audio_files for the async summary/refinement endpoints: the ffmpeg validation
+    runs in worker threads, concurrently per file, and byte-identical duplicates are dropped
+    so each recording is transcribed and summarized once
+    """
+    files, file_stats = await asyncio.to_thread(find_meeting_audio_files, meeting_id, user_email)
+    validity = await asyncio.gather(
+        *(asyncio.to_thread(is_valid_audio_file, file_path, file_stats.get(file_path)) for file_path in files)
+    )
+    valid_files = select_valid_audio_files(meeting_id, files, validity)
+    # Hash after validation: fixing a file rewrites its contents
+    content_hashes = await asyncio.gather(
+        *(asyncio.to_thread(get_audio_content_hash, file_path) for file_path in valid_files)
+    )
+    return drop_duplicate_audio_files(valid_files, content_hashes)
+
+def concatenate_wav_files(audio_files: List[str], output_path: str) -> bool:
+    """
+    Concatenate WAV files by copying frames between wave readers and a single writer.
+    Audio is streamed in blocks so the full recordings are never held in memory.
+    Returns False if the files cannot be joined (non-WAV input or mismatched formats).
+    """
+    try:
+        with wave.open(output_path, "wb") as writer:
+            expected_format = None
+            for i, audio_file in enumerate(audio_files):
+                with wave.open(audio_file, "rb") as reader:
+                    params = reader.getparams()
+                    file_format = (params.nchannels, params.sampwidth, params.framerate)
+                    if i == 0:
+                        writer.setparams(params)
+                        expected_format = file_format
+                    elif file_format != expected_format:
+                        print(f"[Gemini] Cannot concatenate {os.path.basename(audio_file)}: format {file_format} differs from {expected_format}")
+                        return False
+                    
+                    while True:
+                        frames = reader.readframes(1 << 16)
+                        if not frames:
+                            break
+                        writer.writeframes(frames)
+        return True
+    except (wave.Error, EOFError, OSError) as e:
+        print(f"[Gemini] WAV concatenation failed: {e}")
+        return False
+
+async def run_ffmpeg(*args: str) -> bool:
+    """Run ffmpeg with the given arguments, returning False (and logging stderr) on failure"""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-nostdin", "-y", "-loglevel", "error", *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        print(f"[Gemini] Could not start ffmpeg: {e}")
+        return False
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        print(f"[Gemini] ffmpeg exited with {process.returncode}: {stderr.decode(errors='replace').strip()}")
+        return False
+    return True
+
+async def concatenate_audio_files(audio_files: List[str], work_dir: str) -> Optional[str]:
+    """
+    Join a meeting's audio files into one recording inside work_dir and return its path.
+    WAV files with matching formats are joined frame by frame; files sharing another
+    container go through ffmpeg's concat demuxer with stream copy (no re-encode); anything
+    else is transcoded to 16kHz mono PCM WAV in parallel and then joined.
+    Returns None if the files cannot be joined.
+    """
+    extensions = {os.path.splitext(f)[1].lower() for f in audio_files}
+    
+    if extensions == {".wav"}:
+        output_path = os.path.join(work_dir, "concatenated.wav")
+        if await asyncio.to_thread(concatenate_wav_files, audio_files, output_path):
+            return output_path
+    elif len(extensions) == 1:
+        list_path = os.path.join(work_dir, "concat.txt")
+        with open(list_path, "w") as list_file:
+            for audio_file in audio_files:
+                escaped_path = os.path.abspath(audio_file).replace("'", "'\\''")
+                list_file.write(f"file '{escaped_path}'\n")
+        output_path = os.path.join(work_dir, "concatenated" + extensions.pop())
+        if await run_ffmpeg("-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", output_path):
+            return output_path
+    
+    # Codecs or formats differ: normalize every file to the same PCM WAV first
+    transcoded_files = [os.path.join(work_dir, f"part_{i:04d}.wav") for i in range(len(audio_files))]
+    results = await asyncio.gather(*(
+        run_ffmpeg("-i", audio_file, "-ar", "16000", "-ac", "1", "-c:a", "pcm_s16le", transcoded_file)
+        for audio_file, transcoded_file in zip(audio_files, transcoded_files)
+    ))
+    if not all(results):
+        return None
+    
+    output_path = os.path.join(work_dir, "concatenated_pcm.wav")
+    if await asyncio.to_thread(concatenate_wav_files, transcoded_files, output_path):
+        return output_path
+    return None
+
+# Cap on LLM API requests this process has in flight at once
+LLM_MAX_CONCURRENCY = 4
+_llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+async def create_chat_completion(**kwargs):
+    """Await an OpenAI chat completion, bounded by the LLM semaphore"""
+    async with _llm_semaphore:
+        return await get_openai_client().chat.completions.create(**kwargs)
+
+async def stream_chat_completion(**kwargs):
+    """Yield the text deltas of an OpenAI chat completion as they are generated"""
+    async with _llm_semaphore:
+        stream = await get_openai_client().chat.completions.create(stream=True, **kwargs)
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+async def summarize_with_gemini_multiple_files(audio_files: List[str]) -> dict:
     if not GEMINI_API_KEY:
         raise RuntimeError("GEMINI_API_KEY is not set in environment.")
     
-    # Combine all audio files into one summary
-    combined_audio_data = []
-    
-    for audio_file in audio_files:
-        with open(audio_file, "rb") as f:
-            audio_bytes = f.read()
-            combined_audio_data.append(audio_bytes)
-    
-    # For now, use the first file for summary (you could concatenate them)
-    # TODO: Implement proper audio concatenation if needed
-    if combined_audio_data:
-        base64_audio = base64.b64encode(combined_audio_data[0]).decode("utf-8")
-        
-        # Detect the MIME type based on file extension
-        first_file = audio_files[0]
-        file_ext = os.path.splitext(first_file)[1].lower()
-        
-        mime_type_map = {
-            '.wav': 'audio/wav',
-            '.webm': 'audio/webm',
-            '.mp3': 'audio/mpeg',
-            '.m4a': 'audio/mp4',
-            '.flac': 'audio/flac',
-            '.ogg': 'audio/ogg',
-            '.aac': 'audio/aac'
+    if not audio_files:
+        return {
+            "summary": "No audio data found.",
+            "meeting_notes": "No audio data found.",
+            "action_items": "No audio data found."
         }
+    
+    # Combine all audio files into one recording so the whole meeting is summarized
+    # in a single request
+    source_file = audio_files[0] if len(audio_files) == 1 else None
+    work_dir = None
+    
+    if len(audio_files) > 1:
+        work_dir = tempfile.mkdtemp(prefix="gemini_concat_")
+        source_file = await concatenate_audio_files(audio_files, work_dir)
+        if source_file:
+            print(f"[Gemini] Concatenated {len(audio_files)} audio files for summary")
+    
+    try:
+        if source_file:
+            async with _llm_semaphore:
+                return await asyncio.to_thread(_summarize_audio_file_with_gemini, source_file, audio_files)
         
-        mime_type = mime_type_map.get(file_ext, 'audio/wav')  # Default to wav
-        print(f"[Gemini] Using MIME type {mime_type} for file {os.path.basename(first_file)}")
+        # The files can't be joined: summarize each one concurrently and merge the sections
+        print(f"[Gemini] Summarizing {len(audio_files)} audio files separately")
         
-        # Initialize Gemini
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("models/gemini-1.5-pro-latest")
+        async def summarize_file(audio_file: str) -> dict:
+            async with _llm_semaphore:
+                return await asyncio.to_thread(_summarize_audio_file_with_gemini, audio_file, [audio_file])
         
-        # Prepare the prompt and content for structured output (without action items)
-        file_list = ", ".join([f.split('/')[-1] for f in audio_files])
-        prompt = f"""Analyze this meeting audio and provide a structured response with the following sections. Please respond in English only.
+        file_sections = await asyncio.gather(*(summarize_file(audio_file) for audio_file in audio_files))
+        return {
+            "summary": "\n\n".join(sections["summary"] for sections in file_sections if sections["summary"]),
+            "meeting_notes": "\n\n".join(sections["meeting_notes"] for sections in file_sections if sections["meeting_notes"]),
+            "action_items": "Action items will be generated using ChatGPT..."
+        }
+    finally:
+        if work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+# Upper bound on polling an uploaded file that Gemini is still processing
+GEMINI_FILE_PROCESSING_TIMEOUT_SECONDS = 60
+
+def generate_gemini_audio_content(model, prompt: str, audio_path: str, mime_type: str):
+    """
+    Ask Gemini about an audio file. The File API streams the recording from disk;
+    inline base64 (the whole file in memory, inflated by a third) is only the
+    fallback when the upload fails
+    """
+    try:
+        uploaded_file = genai.upload_file(path=audio_path, mime_type=mime_type)
+    except Exception as e:
+        print(f"[Gemini] File upload failed, sending audio inline: {e}")
+        # Encode straight from a read-only mapping rather than a bytes copy of the file
+        with open(audio_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_audio:
+            base64_audio = base64.b64encode(mapped_audio).decode("ascii")
+        return model.generate_content([
+            {"text": prompt},
+            {"inline_data": {"mime_type": mime_type, "data": base64_audio}},
+        ])
+    
+    try:
+        # Audio is normally ready at once; give the service a moment if it isn't
+        for _ in range(GEMINI_FILE_PROCESSING_TIMEOUT_SECONDS):
+            if uploaded_file.state.name != "PROCESSING":
+                break
+            time.sleep(1)
+            uploaded_file = genai.get_file(uploaded_file.name)
+        return model.generate_content([prompt, uploaded_file])
+    finally:
+        try:
+            genai.delete_file(uploaded_file.name)
+        except Exception as e:
+            print(f"[Gemini] Could not delete uploaded file {uploaded_file.name}: {e}")
+
+# Section headers Gemini is asked to emit, each at the start of a line
+_SECTIONS_RE = re.compile(r'^[ \t]*(SUMMARY:|MEETING NOTES:)', re.MULTILINE)
+_SECTION_KEYS = {"SUMMARY:": "summary", "MEETING NOTES:": "meeting_notes"}
+
+def _summarize_audio_file_with_gemini(source_file: str, audio_files: List[str]) -> dict:
+    """Send a single (possibly concatenated) meeting recording to Gemini and parse the sections"""
+    # Detect the MIME type based on file extension
+    file_ext = "." + source_file.rpartition(".")[2].lower()
+    mime_type = AUDIO_MIME_TYPES.get(file_ext, 'audio/wav')  # Default to wav
+    print(f"[Gemini] Using MIME type {mime_type} for file {os.path.basename(source_file)}")
+    
+    # Initialize Gemini
+    model = get_gemini_model()
+    
+    # Prepare the prompt and content for structured output (without action items)
+    file_list = ", ".join([f.split('/')[-1] for f in audio_files])
+    prompt = f"""Analyze this meeting audio and provide a structured response with the following sections. Please respond in English only.
 
 1. **SUMMARY**: A concise overview of the meeting's main points and outcomes
 2. **MEETING NOTES**: Detailed notes covering key discussions, decisions, and important points mentioned
@@ -2421,174 +2725,196 @@ MEETING NOTES:
 [Your detailed notes here]
 
 Files processed: {file_list}"""
-        
-        parts = [
-            {"text": prompt},
-            {"inline_data": {"mime_type": mime_type, "data": base64_audio}},
-        ]
-        
-        # Call Gemini
-        response = model.generate_content(parts)
-        full_response = response.text or "No content generated."
-        
-        # Parse the structured response
-        sections = {
-            "summary": "",
-            "meeting_notes": "",
-            "action_items": ""  # Will be filled by ChatGPT
-        }
-        
-        # Split the response into sections
-        lines = full_response.split('\n')
-        current_section = None
-        current_content = []
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('SUMMARY:'):
-                if current_section and current_content:
-                    sections[current_section] = '\n'.join(current_content).strip()
-                current_section = "summary"
-                current_content = []
-                # Add content after the colon if any
-                content_after_colon = line[8:].strip()
-                if content_after_colon:
-                    current_content.append(content_after_colon)
-            elif line.startswith('MEETING NOTES:'):
-                if current_section and current_content:
-                    sections[current_section] = '\n'.join(current_content).strip()
-                current_section = "meeting_notes"
-                current_content = []
-                # Add content after the colon if any
-                content_after_colon = line[14:].strip()
-                if content_after_colon:
-                    current_content.append(content_after_colon)
-            elif current_section and line:
-                current_content.append(line)
-        
-        # Don't forget the last section
-        if current_section and current_content:
-            sections[current_section] = '\n'.join(current_content).strip()
-        
-        # If parsing failed, put everything in summary
-        if not sections["summary"] and not sections["meeting_notes"]:
-            sections["summary"] = full_response
-            sections["meeting_notes"] = "No structured meeting notes available."
-        
-        # Set placeholder for action items (will be generated by ChatGPT later)
-        sections["action_items"] = "Action items will be generated using ChatGPT..."
-        
-        return sections
     
-    return {
-        "summary": "No audio data found.",
-        "meeting_notes": "No audio data found.",
-        "action_items": "No audio data found."
+    # Call Gemini
+    response = generate_gemini_audio_content(model, prompt, source_file, mime_type)
+    full_response = response.text or "No content generated."
+    
+    # Parse the structured response
+    sections = {
+        "summary": "",
+        "meeting_notes": "",
+        "action_items": ""  # Will be filled by ChatGPT
     }
+    
+    # Slice the response between the section headers
+    headers = list(_SECTIONS_RE.finditer(full_response))
+    for i, header in enumerate(headers):
+        section_end = headers[i + 1].start() if i + 1 < len(headers) else len(full_response)
+        sections[_SECTION_KEYS[header.group(1)]] = full_response[header.end():section_end].strip()
+    
+    # If parsing failed, put everything in summary
+    if not sections["summary"] and not sections["meeting_notes"]:
+        sections["summary"] = full_response
+        sections["meeting_notes"] = "No structured meeting notes available."
+    
+    # Set placeholder for action items (will be generated by ChatGPT later)
+    sections["action_items"] = "Action items will be generated using ChatGPT..."
+    
+    return sections
 
 def summarize_with_gemini(wav_path: str) -> str:
     if not GEMINI_API_KEY:
         raise RuntimeError("GEMINI_API_KEY is not set in environment.")
-    # Read the audio file and encode as base64
-    with open(wav_path, "rb") as f:
-        audio_bytes = f.read()
-    base64_audio = base64.b64encode(audio_bytes).decode("utf-8")
-
     # Initialize Gemini
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel("models/gemini-1.5-pro-latest")
+    model = get_gemini_model()
 
-    # Prepare the prompt and content (use 'parts' with correct keys)
     prompt = "Summarize the main points and action items from this meeting audio. Please respond in English only."
-    parts = [
-        {"text": prompt},
-        {"inline_data": {"mime_type": "audio/wav", "data": base64_audio}},
-    ]
 
     # Call Gemini
-    response = model.generate_content(parts)
+    response = generate_gemini_audio_content(model, prompt, wav_path, "audio/wav")
     return response.text or "No summary generated."
 
-async def generate_action_items_with_chatgpt(meeting_id: int, db: Session) -> str:
+ACTION_ITEMS_PROMPT = """I will give you a meeting transcription. Please analyze it and prepare a comprehensive list of action items. Please respond in English only.
+
+For each action item, please include:
+- The specific task or action to be taken
+- Who is responsible (if mentioned)
+- Any deadlines or timeframes (if mentioned)
+- Priority level (if apparent from context)
+
+Format the response as a clear, organized list. If no action items are found, please state that clearly.
+
+Here is the meeting transcription:"""
+
+def load_meeting_transcript(db: Session, meeting_id: int) -> Tuple[str, list]:
+    """
+    Fetch a meeting's (speaker, text, timestamp) rows in timestamp order and render them
+    as '[HH:MM:SS] Speaker: text' lines. Returns (full_transcript, rows), so callers that
+    need both the text and the rows share one query.
+    """
+    transcriptions = db.query(
+        models.Transcription.speaker,
+        models.Transcription.text,
+        models.Transcription.timestamp
+    ).filter(
+        models.Transcription.meeting_id == meeting_id
+    ).order_by(models.Transcription.timestamp, models.Transcription.id).all()
+    
+    lines = []
+    for speaker, text, timestamp in transcriptions:
+        timestamp_text = timestamp.strftime("%H:%M:%S") if timestamp else "00:00:00"
+        lines.append(f"[{timestamp_text}] {speaker or 'Unknown'}: {text or ''}\n")
+    return "".join(lines), transcriptions
+
+def get_meeting_transcript_text(db: Session, meeting_id: int) -> str:
+    """Render a meeting's transcriptions as '[HH:MM:SS] Speaker: text' lines"""
+    return load_meeting_transcript(db, meeting_id)[0]
+
+def action_items_completion_args(full_transcript: str) -> dict:
+    """Chat completion arguments for extracting action items from a transcript"""
+    return {
+        "model": "gpt-4o",
+        "messages": [
+            {
+                "role": "system", 
+                "content": "You are an expert meeting analyst specializing in extracting actionable items from meeting transcripts. You provide clear, organized, and comprehensive action item lists. Always respond in English only."
+            },
+            {
+                "role": "user", 
+                "content": f"{ACTION_ITEMS_PROMPT}\n\n{full_transcript}"
+            }
+        ],
+        "max_tokens": 1500,
+        "temperature": 0.3  # Lower temperature for more focused, consistent output
+    }
+
+async def generate_action_items_with_chatgpt(meeting_id: int, db: Session, transcript: Optional[Tuple[str, list]] = None) -> str:
     """
     Generate action items using ChatGPT GPT-4o model based on meeting transcriptions.
+    transcript is a preloaded load_meeting_transcript result; it is fetched when omitted.
     """
     try:
         # Check if OpenAI API key is available
         if not settings.OPENAI_API_KEY:
             return "OpenAI API key not configured. Cannot generate action items with ChatGPT."
         
-        # Get all transcriptions for the meeting
-        transcriptions = db.query(models.Transcription).filter(
-            models.Transcription.meeting_id == meeting_id
-        ).order_by(models.Transcription.timestamp).all()
-        
-        if not transcriptions:
+        full_transcript = (transcript or load_meeting_transcript(db, meeting_id))[0]
+        if not full_transcript:
             return "No transcriptions available for action items generation."
-        
-        # Combine all transcription text into a single transcript
-        full_transcript = ""
-        for transcription in transcriptions:
-            speaker = transcription.speaker or "Unknown"
-            text = transcription.text or ""
-            timestamp = transcription.timestamp.strftime("%H:%M:%S") if transcription.timestamp else "00:00:00"
-            full_transcript += f"[{timestamp}] {speaker}: {text}\n"
-        
         if not full_transcript.strip():
             return "No transcript content available for action items generation."
         
-        # Initialize OpenAI client with explicit parameters only
-        try:
-            client = OpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                timeout=60.0,  # Explicit timeout
-                max_retries=2   # Explicit retry count
-            )
-        except TypeError:
-            # Fallback for older OpenAI library versions
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
-        # Improved prompt for action items extraction
-        prompt = """I will give you a meeting transcription. Please analyze it and prepare a comprehensive list of action items. Please respond in English only.
-
-For each action item, please include:
-- The specific task or action to be taken
-- Who is responsible (if mentioned)
-- Any deadlines or timeframes (if mentioned)
-- Priority level (if apparent from context)
-
-Format the response as a clear, organized list. If no action items are found, please state that clearly.
-
-Here is the meeting transcription:"""
+        cache_key = llm_cache_key("action_items", "gpt-4o", ACTION_ITEMS_PROMPT, full_transcript)
+        cached_action_items = get_cached_llm_response(cache_key)
+        if cached_action_items is not None:
+            return cached_action_items
         
         # Call ChatGPT GPT-4o
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "system", 
-                    "content": "You are an expert meeting analyst specializing in extracting actionable items from meeting transcripts. You provide clear, organized, and comprehensive action item lists. Always respond in English only."
-                },
-                {
-                    "role": "user", 
-                    "content": f"{prompt}\n\n{full_transcript}"
-                }
-            ],
-            max_tokens=1500,
-            temperature=0.3  # Lower temperature for more focused, consistent output
-        )
+        response = await create_chat_completion(**action_items_completion_args(full_transcript))
         
         action_items = response.choices[0].message.content.strip()
-        return action_items if action_items else "No action items identified from the meeting transcript."
+        if not action_items:
+            return "No action items identified from the meeting transcript."
+        cache_llm_response(cache_key, action_items)
+        return action_items
         
     except Exception as e:
         print(f"Error generating action items with ChatGPT: {e}")
         return f"Error generating action items: {str(e)}"
 
-async def generate_summary_with_openai(meeting_id: int, db: Session) -> dict:
+@app.get("/meetings/{meeting_id}/action-items/stream")
+@limiter.limit("10/minute")  # AI processing intensive
+async def stream_meeting_action_items(
+    request: Request,
+    meeting_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Stream GPT-4o action items for a meeting as server-sent events. The finished
+    text is cached, so the summary endpoint reuses it instead of asking again.
+    """
+    if not crud.owns_meeting(db, meeting_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    if not settings.OPENAI_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="OpenAI API key not configured"
+        )
+    
+    full_transcript = get_meeting_transcript_text(db, meeting_id)
+    if not full_transcript.strip():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No transcript content available for action items generation"
+        )
+    
+    cache_key = llm_cache_key("action_items", "gpt-4o", ACTION_ITEMS_PROMPT, full_transcript)
+    cached_action_items = get_cached_llm_response(cache_key)
+    
+    async def action_item_events():
+        if cached_action_items is not None:
+            yield f"data: {dumps_json({'delta': cached_action_items})}\n\n"
+        else:
+            parts = []
+            try:
+                async for delta in stream_chat_completion(**action_items_completion_args(full_transcript)):
+                    parts.append(delta)
+                    yield f"data: {dumps_json({'delta': delta})}\n\n"
+            except Exception as e:
+                print(f"Error streaming action items with ChatGPT: {e}")
+                yield f"event: error\ndata: {dumps_json({'error': str(e)})}\n\n"
+                return
+            action_items = "".join(parts).strip()
+            if action_items:
+                cache_llm_response(cache_key, action_items)
+        yield "event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(
+        action_item_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+async def generate_summary_with_openai(meeting_id: int, db: Session, transcript: Optional[Tuple[str, list]] = None) -> dict:
     """
     Generate summary and meeting notes using OpenAI GPT-4o model based on meeting transcriptions.
     This is a fallback when Gemini API is not available.
+    transcript is a preloaded load_meeting_transcript result; it is fetched when omitted.
     """
     try:
         # Check if OpenAI API key is available
@@ -2600,9 +2926,7 @@ async def generate_summary_with_openai(meeting_id: int, db: Session) -> dict:
             }
         
         # Get all transcriptions for the meeting
-        transcriptions = db.query(models.Transcription).filter(
-            models.Transcription.meeting_id == meeting_id
-        ).order_by(models.Transcription.timestamp).all()
+        full_transcript, transcriptions = transcript or load_meeting_transcript(db, meeting_id)
         
         if not transcriptions:
             return {
@@ -2611,14 +2935,6 @@ async def generate_summary_with_openai(meeting_id: int, db: Session) -> dict:
                 "action_items": ""
             }
         
-        # Combine all transcription text into a single transcript
-        full_transcript = ""
-        for transcription in transcriptions:
-            speaker = transcription.speaker or "Unknown"
-            text = transcription.text or ""
-            timestamp = transcription.timestamp.strftime("%H:%M:%S") if transcription.timestamp else "00:00:00"
-            full_transcript += f"[{timestamp}] {speaker}: {text}\n"
-        
         if not full_transcript.strip():
             return {
                 "summary": "No transcript content available for summary generation.",
@@ -2626,17 +2942,6 @@ async def generate_summary_with_openai(meeting_id: int, db: Session) -> dict:
                 "action_items": ""
             }
         
-        # Initialize OpenAI client with explicit parameters only
-        try:
-            client = OpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                timeout=60.0,  # Explicit timeout
-                max_retries=2   # Explicit retry count
-            )
-        except TypeError:
-            # Fallback for older OpenAI library versions
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
         # Generate summary
         summary_prompt = """I will give you a meeting transcription. Please analyze it and provide a concise summary of the main points and outcomes. Please respond in English only.
 
@@ -2648,22 +2953,6 @@ Focus on:
 
 Here is the meeting transcription:"""
         
-        summary_response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "system", 
-                    "content": "You are an expert meeting analyst specializing in creating concise, informative summaries of meeting content. Always respond in English only."
-                },
-                {
-                    "role": "user", 
-                    "content": f"{summary_prompt}\n\n{full_transcript}"
-                }
-            ],
-            max_tokens=1000,
-            temperature=0.3
-        )
-        
         # Generate detailed meeting notes
         notes_prompt = """I will give you a meeting transcription. Please analyze it and provide detailed meeting notes covering key discussions, decisions, and important points mentioned. Please respond in English only.
 
@@ -2676,30 +2965,57 @@ Structure the notes with:
 
 Here is the meeting transcription:"""
         
-        notes_response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "system", 
-                    "content": "You are an expert meeting analyst specializing in creating comprehensive, well-structured meeting notes. Always respond in English only."
-                },
-                {
-                    "role": "user", 
-                    "content": f"{notes_prompt}\n\n{full_transcript}"
-                }
-            ],
-            max_tokens=2000,
-            temperature=0.3
+        cache_key = llm_cache_key("summary", "gpt-4o", summary_prompt, notes_prompt, full_transcript)
+        cached_summary = get_cached_llm_response(cache_key)
+        if cached_summary is not None:
+            return dict(cached_summary)
+        
+        # The summary and notes requests are independent, so send them concurrently
+        summary_response, notes_response = await asyncio.gather(
+            create_chat_completion(
+                model="gpt-4o",
+                messages=[
+                    {
+                        "role": "system", 
+                        "content": "You are an expert meeting analyst specializing in creating concise, informative summaries of meeting content. Always respond in English only."
+                    },
+                    {
+                        "role": "user", 
+                        "content": f"{summary_prompt}\n\n{full_transcript}"
+                    }
+                ],
+                max_tokens=1000,
+                temperature=0.3
+            ),
+            create_chat_completion(
+                model="gpt-4o",
+                messages=[
+                    {
+                        "role": "system", 
+                        "content": "You are an expert meeting analyst specializing in creating comprehensive, well-structured meeting notes. Always respond in English only."
+                    },
+                    {
+                        "role": "user", 
+                        "content": f"{notes_prompt}\n\n{full_transcript}"
+                    }
+                ],
+                max_tokens=2000,
+                temperature=0.3
+            )
         )
         
         summary = summary_response.choices[0].message.content.strip()
         meeting_notes = notes_response.choices[0].message.content.strip()
         
-        return {
+        structured_content = {
             "summary": summary if summary else "No summary could be generated from the transcript.",
             "meeting_notes": meeting_notes if meeting_notes else "No meeting notes could be generated from the transcript.",
             "action_items": ""  # Will be filled by the action items function
         }
+        if summary and meeting_notes:
+            cache_llm_response(cache_key, structured_content)
+        # Callers fill in action_items, so hand back a copy of what was cached
+        return dict(structured_content)
         
     except Exception as e:
         print(f"Error generating summary with OpenAI: {e}")
@@ -2709,6 +3025,31 @@ Here is the meeting transcription:"""
             "action_items": ""
         }
 
+# Process pool for WhisperX transcription, created on first use; the workers run
+# transcription_worker, which loads its models once per process
+_whisperx_pool = None
+
+def get_whisperx_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Get the shared process pool used for WhisperX transcription"""
+    global _whisperx_pool
+    if _whisperx_pool is None:
+        # A single GPU process batches on the device; on CPU, one process per free core
+        max_workers = 1 if WHISPERX_DEVICE.startswith("cuda") else get_worker_pool_size()
+        print(f"[ProcessUpload] Creating WhisperX process pool with {max_workers} workers")
+        _whisperx_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_worker_mp_context(),
+            initializer=init_whisperx_worker
+        )
+    return _whisperx_pool
+
+def reset_whisperx_pool() -> None:
+    """Drop a broken WhisperX pool (e.g. a worker was OOM-killed) so the next call builds a new one"""
+    global _whisperx_pool
+    if _whisperx_pool is not None:
+        _whisperx_pool.shutdown(wait=False, cancel_futures=True)
+        _whisperx_pool = None
+
 async def process_uploaded_audio_files(meeting_id: int, audio_files: List[str], db: Session):
     """
     Process uploaded audio files with WhisperX for transcription and speaker diarization.
@@ -2728,138 +3069,61 @@ async def process_uploaded_audio_files(meeting_id: int, audio_files: List[str],
             print(f"[ProcessUpload] No placeholder transcriptions found for meeting {meeting_id}")
             return
         
-        # Import WhisperX
-        try:
-            # Fix for PyTorch 2.6+ weights loading issue with WhisperX
-            import torch
-            
-            # Monkey-patch torch.load to always use weights_only=False
-            _original_torch_load = torch.load
-            def patched_torch_load(*args, **kwargs):
-                kwargs.setdefault('weights_only', False)
-                return _original_torch_load(*args, **kwargs)
-            torch.load = patched_torch_load
-            
-            import whisperx
-            import gc
-            
-        except ImportError:
+        if not WHISPERX_AVAILABLE:
             print("[ProcessUpload] WhisperX not installed, falling back to OpenAI Whisper")
             # Fallback to original OpenAI Whisper implementation
             await process_uploaded_audio_files_fallback(meeting_id, audio_files, db)
             return
         
-        # WhisperX configuration - can be configured via environment variables
-        device = os.getenv("WHISPERX_DEVICE", "cpu")  # Use "cuda" if GPU is available
-        batch_size = int(os.getenv("WHISPERX_BATCH_SIZE", "16"))  # Reduce if low on GPU memory
-        compute_type = os.getenv("WHISPERX_COMPUTE_TYPE", "float32")  # Use "float16" for GPU
-        model_size = os.getenv("WHISPERX_MODEL_SIZE", "base")  # base, small, medium, large
+        transcriber = "faster-whisper" if FASTER_WHISPER_AVAILABLE else f"whisperx (batch_size={WHISPERX_BATCH_SIZE})"
+        print(f"[ProcessUpload] WhisperX config: transcriber={transcriber}, device={WHISPERX_DEVICE}, compute_type={WHISPERX_COMPUTE_TYPE}, model_size={WHISPERX_MODEL_SIZE}")
         
-        print(f"[ProcessUpload] WhisperX config: device={device}, batch_size={batch_size}, compute_type={compute_type}, model_size={model_size}")
+        # Transcribe the files in parallel in the WhisperX process pool
+        loop = asyncio.get_running_loop()
+        pool = get_whisperx_pool()
+        file_results = await asyncio.gather(
+            *(loop.run_in_executor(pool, whisperx_transcribe_file, audio_file) for audio_file in audio_files),
+            return_exceptions=True
+        )
+        if any(isinstance(result, concurrent.futures.process.BrokenProcessPool) for result in file_results):
+            print("[ProcessUpload] WhisperX process pool broke (worker died); it will be recreated")
+            reset_whisperx_pool()
         
-        # Process each audio file with WhisperX
-        for audio_file in audio_files:
-            try:
-                print(f"[ProcessUpload] Processing audio file with WhisperX: {audio_file}")
-                
-                # 1. Load audio
-                audio = whisperx.load_audio(audio_file)
-                print(f"[ProcessUpload] Audio loaded, duration: {len(audio)/16000:.2f} seconds")
-                
-                # 2. Load WhisperX model for transcription
-                model = whisperx.load_model(model_size, device, compute_type=compute_type)
-                
-                # 3. Transcribe with WhisperX with English language specified
-                result = model.transcribe(audio, batch_size=batch_size, language="en")
-                print(f"[ProcessUpload] Transcription completed, found {len(result.get('segments', []))} segments")
-                
-                # 4. Load alignment model and align whisper output
-                try:
-                    # Use English language code for alignment
-                    model_a, metadata = whisperx.load_align_model(language_code="en", device=device)
-                    result = whisperx.align(result["segments"], model_a, metadata, audio, device, return_char_alignments=False)
-                    print(f"[ProcessUpload] Alignment completed")
-                except Exception as align_error:
-                    print(f"[ProcessUpload] Alignment failed: {align_error}")
-                    print("[ProcessUpload] Continuing without alignment")
-                    model_a = None
-                
-                # 5. Assign speaker labels with diarization
-                diarize_model = None
-                try:
-                    # Check if HuggingFace token is available for diarization
-                    hf_token = os.getenv("HUGGINGFACE_TOKEN") or os.getenv("HF_TOKEN")
-                    
-                    # Load diarization model - Updated for newer WhisperX versions
-                    try:
-                        # Try the newer import path first
-                        diarize_model = whisperx.diarize.DiarizationPipeline(use_auth_token=hf_token, device=device)
-                    except AttributeError:
-                        # Fallback to older import path
-                        diarize_model = whisperx.DiarizationPipeline(use_auth_token=hf_token, device=device)
-                    
-                    # Run diarization
-                    diarize_segments = diarize_model(audio_file)
-                    
-                    # Assign speakers to transcription segments
-                    result = whisperx.assign_word_speakers(diarize_segments, result)
-                    print(f"[ProcessUpload] Speaker diarization completed")
-                    
-                except Exception as diarize_error:
-                    print(f"[ProcessUpload] Speaker diarization failed: {diarize_error}")
-                    if "pyannote" in str(diarize_error).lower():
-                        print("[ProcessUpload] Hint: You may need to accept pyannote/speaker-diarization-3.1 user conditions at https://hf.co/pyannote/speaker-diarization-3.1")
-                        print("[ProcessUpload] And set HUGGINGFACE_TOKEN environment variable")
-                    elif "DiarizationPipeline" in str(diarize_error):
-                        print("[ProcessUpload] Hint: WhisperX version compatibility issue. Try updating WhisperX or using a different version.")
-                        print("[ProcessUpload] Alternative: pip install git+https://github.com/m-bain/whisperX.git")
-                    print("[ProcessUpload] Continuing with transcription only (no speaker labels)")
-                
-                # 6. Process segments and create transcription records
-                if result.get("segments"):
-                    for i, segment in enumerate(result["segments"]):
-                        try:
-                            # Extract segment information
-                            text = segment.get("text", "").strip()
-                            start_time = segment.get("start", 0)
-                            end_time = segment.get("end", 0)
-                            
-                            # Get speaker label (from diarization or default)
-                            speaker = segment.get("speaker", f"Speaker_{(i % 3) + 1}")  # Cycle through Speaker_1, Speaker_2, Speaker_3
-                            if not speaker or speaker == "None" or speaker == "SPEAKER_00":
-                                speaker = f"Speaker_{(i % 3) + 1}"
-                            
-                            if text:  # Only create transcription if there's actual text
-                                # Create a new transcription record
-                                new_transcription = models.Transcription(
-                                    meeting_id=meeting_id,
-                                    speaker=speaker,
-                                    text=text,
-                                    timestamp=datetime.utcnow()
-                                )
-                                db.add(new_transcription)
-                                print(f"[ProcessUpload] Added transcription: {speaker}: {text[:50]}...")
-                        
-                        except Exception as segment_error:
-                            print(f"[ProcessUpload] Error processing segment: {segment_error}")
-                            continue
-                
-                # Clean up models to free memory
-                del model
-                if model_a:
-                    del model_a
-                if diarize_model:
-                    del diarize_model
-                gc.collect()
-                
-            except Exception as e:
-                print(f"[ProcessUpload] Error processing audio file {audio_file} with WhisperX: {e}")
+        for audio_file, segments in zip(audio_files, file_results):
+            if isinstance(segments, Exception):
+                print(f"[ProcessUpload] Error processing audio file {audio_file} with WhisperX: {segments}")
                 # Try fallback to OpenAI Whisper for this file
                 try:
                     await process_single_file_fallback(audio_file, meeting_id, db)
                 except Exception as fallback_error:
                     print(f"[ProcessUpload] Fallback also failed for {audio_file}: {fallback_error}")
                 continue
+            
+            # Create transcription records for the segments
+            for i, segment in enumerate(segments):
+                try:
+                    # Extract segment information
+                    text = segment.get("text", "").strip()
+                    
+                    # Get speaker label (from diarization or default)
+                    speaker = segment.get("speaker", f"Speaker_{(i % 3) + 1}")  # Cycle through Speaker_1, Speaker_2, Speaker_3
+                    if not speaker or speaker == "None" or speaker == "SPEAKER_00":
+                        speaker = f"Speaker_{(i % 3) + 1}"
+                    
+                    if text:  # Only create transcription if there's actual text
+                        # Create a new transcription record
+                        new_transcription = models.Transcription(
+                            meeting_id=meeting_id,
+                            speaker=speaker,
+                            text=text,
+                            timestamp=datetime.utcnow()
+                        )
+                        db.add(new_transcription)
+                        print(f"[ProcessUpload] Added transcription: {speaker}: {text[:50]}...")
+                
+                except Exception as segment_error:
+                    print(f"[ProcessUpload] Error processing segment: {segment_error}")
+                    continue
         
         # Remove placeholder transcriptions
         for placeholder in placeholder_transcriptions:
@@ -2960,19 +3224,11 @@ async def process_single_file_fallback(audio_file: str, meeting_id: int, db: Ses
                 print(f"[ProcessUpload] Added placeholder transcription for unprocessable file")
                 return
         
-        # Use OpenAI Whisper to transcribe the audio with defensive client initialization
-        try:
-            client = OpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                timeout=60.0,  # Explicit timeout
-                max_retries=2   # Explicit retry count
-            )
-        except TypeError:
-            # Fallback for older OpenAI library versions
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # Use OpenAI Whisper to transcribe the audio with the shared client
+        client = get_openai_client()
         
         with open(audio_file, "rb") as f:
-            transcript = client.audio.transcriptions.create(
+            transcript = await client.audio.transcriptions.create(
                 model="whisper-1",
                 language="en",  # Specify English language
                 file=f,
@@ -3004,9 +3260,14 @@ async def process_single_file_fallback(audio_file: str, meeting_id: int, db: Ses
         print(f"[ProcessUpload] Error processing audio file {audio_file} with OpenAI Whisper: {e}")
         raise e
 
-def group_consecutive_speaker_phrases(transcriptions: List[models.Transcription]) -> List[Dict[str, Any]]:
+def group_consecutive_speaker_phrases(
+    transcriptions: List[models.Transcription],
+    speaker_mapping: Optional[Dict[str, str]] = None
+) -> List[Dict[str, Any]]:
     """
     Group consecutive phrases from the same speaker into single entries.
+    Accepts ORM objects or (id, speaker, text, timestamp) column rows; speakers are
+    renamed through speaker_mapping first when one is given.
     Returns a list of grouped transcription data.
     """
     if not transcriptions:
@@ -3017,6 +3278,8 @@ def group_consecutive_speaker_phrases(transcriptions: List[models.Transcription]
     
     for transcription in transcriptions:
         speaker = transcription.speaker or "Unknown"
+        if speaker_mapping:
+            speaker = speaker_mapping.get(speaker, speaker)
         text = transcription.text or ""
         timestamp = transcription.timestamp
         
@@ -3102,10 +3365,7 @@ async def group_meeting_transcriptions(
         print(f"[GroupTranscriptions] Starting transcription grouping for meeting {meeting_id}")
         
         # Verify the meeting exists and belongs to the current user
-        meeting = db.query(models.Meeting).filter(
-            models.Meeting.id == meeting_id,
-            models.Meeting.owner_id == current_user.id
-        ).first()
+        meeting = crud.get_owned_meeting(db, meeting_id, current_user.id)
         
         if not meeting:
             raise HTTPException(
@@ -3113,10 +3373,16 @@ async def group_meeting_transcriptions(
                 detail="Meeting not found"
             )
         
-        # Get all transcriptions for this meeting, ordered by timestamp
-        transcriptions = db.query(models.Transcription).filter(
+        # Get all transcriptions for this meeting, ordered by timestamp (only the
+        # columns grouping reads)
+        transcriptions = db.query(
+            models.Transcription.id,
+            models.Transcription.speaker,
+            models.Transcription.text,
+            models.Transcription.timestamp
+        ).filter(
             models.Transcription.meeting_id == meeting_id
-        ).order_by(models.Transcription.timestamp).all()
+        ).order_by(models.Transcription.timestamp, models.Transcription.id).all()
         
         if not transcriptions:
             return {
@@ -3161,7 +3427,6 @@ async def group_meeting_transcriptions(
         raise
     except Exception as e:
         print(f"[GroupTranscriptions] Error in transcription grouping: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3187,6 +3452,8 @@ async def readiness_check():
 @app.get("/metrics")
 async def get_metrics():
     """System metrics for monitoring"""
+    import psutil  # Only needed here; kept off the startup import path
+    
     memory = psutil.virtual_memory()
     cpu = psutil.cpu_percent(interval=1)
     
@@ -3215,6 +3482,7 @@ ALLOWED_AUDIO_MIMETYPES = {
     'video/webm'  # WebM files are often detected as video even when audio-only
 }
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
 MAX_FILENAME_LENGTH = 255
 
 def validate_audio_file(file: UploadFile) -> None:
@@ -3320,18 +3588,34 @@ async def save_uploaded_file_securely(file: UploadFile, destination_dir: str) ->
     # Ensure destination directory exists
     os.makedirs(destination_dir, exist_ok=True)
     
-    # Read file content with size limit
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
+    # Stream the upload to disk in 1MB chunks, enforcing the size limit as we go,
+    # so large uploads neither sit in memory nor block the event loop on writes
+    bytes_written = 0
+    too_large = False
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(file_path, 'wb') as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                bytes_written += len(chunk)
+                if bytes_written > MAX_FILE_SIZE:
+                    too_large = True
+                    break
+                await f.write(chunk)
+    else:
+        with open(file_path, 'wb') as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                bytes_written += len(chunk)
+                if bytes_written > MAX_FILE_SIZE:
+                    too_large = True
+                    break
+                await asyncio.to_thread(f.write, chunk)
+    
+    if too_large:
+        os.remove(file_path)
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB"
         )
     
-    # Save file
-    with open(file_path, 'wb') as f:
-        f.write(content)
-    
     # Validate file content after saving
     validate_file_content(file_path)
     
@@ -3526,10 +3810,7 @@ def cleanup_meeting_audio_endpoint(
     after the meeting has been summarized.
     """
     # Verify the meeting exists and belongs to the current user
-    meeting = db.query(models.Meeting).filter(
-        models.Meeting.id == meeting_id,
-        models.Meeting.owner_id == current_user.id
-    ).first()
+    meeting = crud.get_owned_meeting(db, meeting_id, current_user.id)
     
     if not meeting:
         raise HTTPException(
@@ -3643,9 +3924,10 @@ def get_user_storage_usage(
             detail=f"Failed to get storage usage: {str(e)}"
         )
 
-async def generate_tags_with_chatgpt(meeting_id: int, db: Session) -> List[str]:
+async def generate_tags_with_chatgpt(meeting_id: int, db: Session, transcript: Optional[Tuple[str, list]] = None) -> List[str]:
     """
     Generate 2-5 relevant tags for a meeting using ChatGPT based on meeting transcriptions and summary.
+    transcript is a preloaded load_meeting_transcript result; it is fetched when omitted.
     """
     try:
         # Check if OpenAI API key is available
@@ -3653,9 +3935,7 @@ async def generate_tags_with_chatgpt(meeting_id: int, db: Session) -> List[str]:
             return []
         
         # Get all transcriptions for the meeting
-        transcriptions = db.query(models.Transcription).filter(
-            models.Transcription.meeting_id == meeting_id
-        ).order_by(models.Transcription.timestamp).all()
+        transcriptions = (transcript or load_meeting_transcript(db, meeting_id))[1]
         
         # Get the latest summary if available
         latest_summary = crud.get_latest_meeting_summary(db, meeting_id)
@@ -3664,39 +3944,23 @@ async def generate_tags_with_chatgpt(meeting_id: int, db: Session) -> List[str]:
             return []
         
         # Combine transcription text and summary for context
-        context_text = ""
-        
-        if transcriptions:
-            for transcription in transcriptions:
-                speaker = transcription.speaker or "Unknown"
-                text = transcription.text or ""
-                context_text += f"{speaker}: {text}\n"
+        context_parts = [f"{speaker or 'Unknown'}: {text or ''}\n" for speaker, text, _ in transcriptions]
         
         if latest_summary:
             try:
                 # Try to parse as JSON to get summary content
-                parsed_content = json.loads(latest_summary.content)
+                parsed_content = loads_json(latest_summary.content)
                 if isinstance(parsed_content, dict) and "summary" in parsed_content:
-                    context_text += f"\nSummary: {parsed_content['summary']}"
+                    context_parts.append(f"\nSummary: {parsed_content['summary']}")
                 else:
-                    context_text += f"\nSummary: {latest_summary.content}"
+                    context_parts.append(f"\nSummary: {latest_summary.content}")
             except (json.JSONDecodeError, TypeError):
-                context_text += f"\nSummary: {latest_summary.content}"
+                context_parts.append(f"\nSummary: {latest_summary.content}")
+        context_text = "".join(context_parts)
         
         if not context_text.strip():
             return []
         
-        # Initialize OpenAI client with explicit parameters only
-        try:
-            client = OpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                timeout=60.0,  # Explicit timeout
-                max_retries=2   # Explicit retry count
-            )
-        except TypeError:
-            # Fallback for older OpenAI library versions
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
         # Prompt for tag generation
         prompt = """I will give you meeting content (transcriptions and summary). Please analyze it and generate 2-5 relevant tags that best categorize this meeting. Please respond in English only.
 
@@ -3713,7 +3977,7 @@ Examples of good tags: "project planning", "budget review", "team sync", "client
 Here is the meeting content:"""
         
         # Call ChatGPT
-        response = client.chat.completions.create(
+        response = await create_chat_completion(
             model="gpt-4o",
             messages=[
                 {
@@ -3841,10 +4105,7 @@ def debug_meeting_audio(
     """
     try:
         # Verify meeting exists
-        meeting = db.query(models.Meeting).filter(
-            models.Meeting.id == meeting_id,
-            models.Meeting.owner_id == current_user.id
-        ).first()
+        meeting = crud.get_owned_meeting(db, meeting_id, current_user.id)
         
         if not meeting:
             raise HTTPException(
@@ -4006,9 +4267,15 @@ if __name__ == "__main__":
         "port": int(os.getenv("PORT", 8000)),
         "reload": os.getenv("ENVIRONMENT", "development") == "development",
         "access_log": True,
-        "log_level": "info"
+        "log_level": "info",
+        "loop": "uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        "http": "httptools" if HTTPTOOLS_AVAILABLE else "h11"
     }
     
+    # Multiple workers are not supported together with reload; each worker loads its own models
+    if not uvicorn_config["reload"]:
+        uvicorn_config["workers"] = int(os.getenv("WEB_CONCURRENCY", "1"))
+    
     # Add SSL configuration if certificates are provided
     if ssl_keyfile and ssl_certfile and os.path.exists(ssl_keyfile) and os.path.exists(ssl_certfile):
         uvicorn_config.update({
@@ -1,6 +1,7 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Text, Table, Enum
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Text, Table, Enum, Index
 import enum
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from datetime import datetime
 from database import Base
 
@@ -80,10 +81,18 @@ class Transcription(Base):
     meeting_id = Column(Integer, ForeignKey("meetings.id"))
     speaker = Column(String)
     text = Column(Text)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    # ORM inserts (including bulk_insert_mappings) are stamped per row in Python UTC, like
+    # the explicit datetime.utcnow() stamps elsewhere; the server default only covers raw SQL
+    timestamp = Column(DateTime, default=datetime.utcnow, server_default=func.now())
     
     meeting = relationship("Meeting", back_populates="transcriptions")
 
+    # Transcripts are always read per meeting in (timestamp, id) order; id breaks ties
+    # between rows inserted in the same batch
+    __table_args__ = (
+        Index("ix_transcription_meeting_ts", "meeting_id", "timestamp", "id"),
+    )
+
 class Summary(Base):
     __tablename__ = "summaries"
 
@@ -37,6 +37,14 @@ class SpeakerIdentifier:
         # Define a processing interval (e.g., process accumulated audio every X seconds)
         self.processing_interval_duration = 2.0 # seconds - Reduced interval for faster processing
         self.last_process_time = 0.0
+        self.ready = True # Cleared by cleanup(); checked per chunk instead of attribute probing
+
+    def cleanup(self):
+        """Release the models and buffered audio; the identifier is unusable afterwards."""
+        self.ready = False
+        self.audio_buffer = np.array([], dtype=np.float32)
+        self.pipeline = None
+        self.whisper_model = None
 
     @staticmethod
     def process_single_chunk(
@@ -217,6 +225,14 @@ class FallbackSpeakerIdentifier:
         self.processing_interval_duration = 2.0
         self.last_process_time = 0.0
         self.speaker_counter = 1  # Simple speaker counter for fallback
+        self.ready = True
+
+    def cleanup(self):
+        """Release the Whisper model and buffered audio; the identifier is unusable afterwards."""
+        self.ready = False
+        self.audio_buffer = np.array([], dtype=np.float32)
+        self.whisper_model = None
+        self.has_whisper = False
 
     def get_buffer_duration_seconds(self) -> float:
         """Get the duration of audio currently in the internal buffer in seconds."""
@@ -26,4 +26,4 @@ fi
 
 # Start the application
 echo "🎯 Starting the application..."
-python -m uvicorn main:app --host 0.0.0.0 --port ${PORT:-8000} --workers 1 
\ No newline at end of file
+python -m uvicorn main:app --host 0.0.0.0 --port ${PORT:-8000} --workers ${WEB_CONCURRENCY:-1} --loop uvloop --http httptools 
\ No newline at end of file
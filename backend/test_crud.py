@@ -356,7 +356,24 @@ class TestMeetingCRUD:
         assert ended_meeting.is_ended is True
         assert ended_meeting.end_time is not None
         assert ended_meeting.status == "completed"
-    
+
+    def test_owns_meeting(self, db_session, test_user, test_meeting):
+        """Test the owner passes the ownership check"""
+        assert crud.owns_meeting(db_session, test_meeting.id, test_user.id) is True
+
+    def test_owns_meeting_other_user(self, db_session, test_meeting):
+        """Test another user fails the ownership check"""
+        other_user = crud.create_user(
+            db_session,
+            schemas.UserCreate(email="other@example.com", password="OtherPassword123!")
+        )
+
+        assert crud.owns_meeting(db_session, test_meeting.id, other_user.id) is False
+
+    def test_owns_meeting_nonexistent(self, db_session, test_user):
+        """Test a missing meeting fails the ownership check"""
+        assert crud.owns_meeting(db_session, 99999, test_user.id) is False
+
     def test_get_meeting_status(self, db_session, test_user, test_meeting):
         """Test getting meeting status"""
         status = crud.get_meeting_status(
@@ -410,6 +427,60 @@ class TestSummaryCRUD:
         assert latest_summary.content == "Summary 2"
 
 
+class TestMeetingWithLatestSummaryCRUD:
+    """Test loading a meeting with its latest summary and notes"""
+
+    def test_meeting_without_summary_or_notes(self, db_session, test_user, test_meeting):
+        """Test a meeting with no summary or notes returns empty content"""
+        row = crud.get_meeting_with_latest_summary_and_notes(db_session, test_meeting.id, test_user.id)
+
+        assert row is not None
+        meeting, summary_content, notes_content = row
+        assert meeting.id == test_meeting.id
+        assert summary_content is None
+        assert notes_content is None
+
+    def test_meeting_owned_by_another_user(self, db_session, test_meeting):
+        """Test a meeting owned by another user is not returned"""
+        other_user = crud.create_user(
+            db_session,
+            schemas.UserCreate(email="other@example.com", password="OtherPassword123!")
+        )
+
+        row = crud.get_meeting_with_latest_summary_and_notes(db_session, test_meeting.id, other_user.id)
+        assert row is None
+
+    def test_nonexistent_meeting(self, db_session, test_user):
+        """Test a missing meeting is not returned"""
+        row = crud.get_meeting_with_latest_summary_and_notes(db_session, 99999, test_user.id)
+        assert row is None
+
+    def test_picks_latest_summary_and_notes(self, db_session, test_user, test_meeting):
+        """Test the newest of several summaries and notes is returned"""
+        base_time = datetime.utcnow()
+        # Insert out of order so the result depends on generated_at, not on id
+        for i in (1, 2, 0):
+            summary = crud.create_summary(
+                db_session,
+                schemas.SummaryCreate(meeting_id=test_meeting.id, content=f"Summary {i}")
+            )
+            notes = crud.create_meeting_notes(
+                db_session,
+                schemas.MeetingNotesCreate(meeting_id=test_meeting.id, content=f"Notes {i}")
+            )
+            summary.generated_at = base_time + timedelta(minutes=i)
+            notes.generated_at = base_time + timedelta(minutes=i)
+        db_session.commit()
+
+        meeting, summary_content, notes_content = crud.get_meeting_with_latest_summary_and_notes(
+            db_session, test_meeting.id, test_user.id
+        )
+
+        assert meeting.id == test_meeting.id
+        assert summary_content == "Summary 2"
+        assert notes_content == "Notes 2"
+
+
 class TestUtilityFunctions:
     """Test utility functions in CRUD"""
     
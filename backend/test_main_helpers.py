@@ -0,0 +1,333 @@
+"""
+Unit tests for standalone helpers in main.py
+These tests call the helpers directly and do not go through the API client
+"""
+import pytest
+import os
+import random
+import numpy as np
+from unittest.mock import patch, MagicMock
+
+# Set environment variables for testing
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("SECRET_KEY", "this-is-a-test-secret-key-with-more-than-32-characters")
+os.environ.setdefault("OPENAI_API_KEY", "sk-test-key-for-testing-only-not-real")
+os.environ["TESTING"] = "true"
+
+import main
+
+
+def reference_merge_speaker_runs(pending_segment, pending_speaker_id, segments, speaker_ids, time_tolerance):
+    """The per-segment merge loop stream_audio used before merge_speaker_runs"""
+    finalized_segments = []
+    current_merged_segment = None if pending_segment is None else dict(pending_segment)
+    current_speaker_id = pending_speaker_id
+
+    for segment in segments:
+        segment = dict(segment)
+        speaker_id = speaker_ids.get(segment["speaker"])
+        if speaker_id is None:
+            speaker_id = speaker_ids[segment["speaker"]] = len(speaker_ids)
+        if current_merged_segment is None:
+            current_merged_segment = segment
+            current_speaker_id = speaker_id
+        elif (speaker_id == current_speaker_id and
+              segment["start_time"] - current_merged_segment["end_time"] <= time_tolerance):
+            current_merged_segment["text"] += " " + segment["text"]
+            current_merged_segment["end_time"] = segment["end_time"]
+        else:
+            finalized_segments.append(current_merged_segment)
+            current_merged_segment = segment
+            current_speaker_id = speaker_id
+
+    return finalized_segments, current_merged_segment, current_speaker_id
+
+
+def run_chunks(merge, chunks, time_tolerance):
+    """Feed chunks through a merge function the way stream_audio does"""
+    speaker_ids = {}
+    pending_segment = None
+    pending_speaker_id = None
+    finalized = []
+    for chunk in chunks:
+        done, pending_segment, pending_speaker_id = merge(
+            pending_segment, pending_speaker_id, chunk, speaker_ids, time_tolerance
+        )
+        finalized.extend(done)
+    if pending_segment is not None:
+        finalized.append(pending_segment)
+    return finalized
+
+
+def segment(speaker, start_time, end_time, text):
+    return {"speaker": speaker, "start_time": start_time, "end_time": end_time, "text": text}
+
+
+class TestMergeSpeakerRuns:
+    """Test merge_speaker_runs against the original merge loop"""
+
+    def test_empty_chunk_keeps_pending(self):
+        """Test an empty chunk leaves the open run untouched"""
+        pending = segment("Speaker 1", 0.0, 1.0, "hello")
+        assert main.merge_speaker_runs(pending, 0, [], {"Speaker 1": 0}, 0.5) == ([], pending, 0)
+
+    def test_same_speaker_within_tolerance_merges(self):
+        """Test consecutive segments from one speaker are joined"""
+        finalized, open_segment, open_speaker_id = main.merge_speaker_runs(
+            None, None,
+            [segment("Speaker 1", 0.0, 1.0, "hello"), segment("Speaker 1", 1.2, 2.0, "there")],
+            {}, 0.5
+        )
+        assert finalized == []
+        assert open_segment == segment("Speaker 1", 0.0, 2.0, "hello there")
+        assert open_speaker_id == 0
+
+    def test_speaker_change_breaks_run(self):
+        """Test a different speaker finalizes the previous run"""
+        speaker_ids = {}
+        finalized, open_segment, open_speaker_id = main.merge_speaker_runs(
+            None, None,
+            [segment("Speaker 1", 0.0, 1.0, "hello"), segment("Speaker 2", 1.1, 2.0, "hi")],
+            speaker_ids, 0.5
+        )
+        assert finalized == [segment("Speaker 1", 0.0, 1.0, "hello")]
+        assert open_segment == segment("Speaker 2", 1.1, 2.0, "hi")
+        assert open_speaker_id == speaker_ids["Speaker 2"]
+
+    def test_gap_wider_than_tolerance_breaks_run(self):
+        """Test a gap wider than time_tolerance splits the same speaker"""
+        finalized, open_segment, _ = main.merge_speaker_runs(
+            None, None,
+            [segment("Speaker 1", 0.0, 1.0, "hello"), segment("Speaker 1", 1.6, 2.0, "again")],
+            {}, 0.5
+        )
+        assert finalized == [segment("Speaker 1", 0.0, 1.0, "hello")]
+        assert open_segment == segment("Speaker 1", 1.6, 2.0, "again")
+
+    def test_pending_segment_carries_across_chunks(self):
+        """Test the open run from one chunk merges into the next chunk"""
+        chunks = [
+            [segment("Speaker 1", 0.0, 1.0, "one"), segment("Speaker 1", 1.2, 2.0, "two")],
+            [segment("Speaker 1", 2.3, 3.0, "three"), segment("Speaker 2", 3.1, 4.0, "four")],
+        ]
+        assert run_chunks(main.merge_speaker_runs, chunks, 0.5) == [
+            segment("Speaker 1", 0.0, 3.0, "one two three"),
+            segment("Speaker 2", 3.1, 4.0, "four"),
+        ]
+
+    def test_does_not_mutate_input_segments(self):
+        """Test merged runs are new dicts rather than edits of the inputs"""
+        first = segment("Speaker 1", 0.0, 1.0, "hello")
+        second = segment("Speaker 1", 1.2, 2.0, "there")
+        main.merge_speaker_runs(None, None, [first, second], {}, 0.5)
+        assert first == segment("Speaker 1", 0.0, 1.0, "hello")
+
+    def test_matches_reference_on_random_chunks(self):
+        """Test randomized chained chunks produce the same output as the original loop"""
+        rng = random.Random(1234)
+        for _ in range(300):
+            time_tolerance = rng.choice([0.0, 0.25, 0.5, 1.0])
+            clock = 0.0
+            chunks = []
+            for _ in range(rng.randint(1, 5)):
+                chunk = []
+                for _ in range(rng.randint(0, 8)):
+                    # Gaps straddle the tolerance, including exactly equal to it
+                    clock += rng.choice([0.0, time_tolerance, rng.uniform(0.0, 2.0)])
+                    duration = rng.uniform(0.1, 1.5)
+                    chunk.append(segment(
+                        f"Speaker {rng.randint(1, 3)}", clock, clock + duration, f"w{rng.randint(0, 99)}"
+                    ))
+                    clock += duration
+                chunks.append(chunk)
+
+            expected = run_chunks(
+                reference_merge_speaker_runs, [[dict(s) for s in chunk] for chunk in chunks], time_tolerance
+            )
+            assert run_chunks(main.merge_speaker_runs, chunks, time_tolerance) == expected
+
+
+class TestCoalesceAudioChunks:
+    """Test grouping of chunker output before speaker processing"""
+
+    @staticmethod
+    def chunk(start, end, sample_rate=10):
+        return (np.full(int(round((end - start) * sample_rate)), start, dtype=np.float32), start, end)
+
+    def test_single_chunk_passes_through(self):
+        """Test a group of one is returned unchanged"""
+        chunk = self.chunk(3.0, 5.0)
+        assert main.coalesce_audio_chunks([chunk], max_chunks=4) == [chunk]
+
+    def test_group_keeps_first_chunk_start(self):
+        """Test a merged group starts at its first chunk and spans its chunks' audio"""
+        chunks = [self.chunk(10.0, 12.0), self.chunk(12.0, 13.5), self.chunk(14.0, 15.0)]
+        (audio, start, end), = main.coalesce_audio_chunks(chunks, max_chunks=4)
+        assert start == 10.0
+        assert end == pytest.approx(14.5)
+        np.testing.assert_array_equal(audio, np.concatenate([chunk[0] for chunk in chunks]))
+
+    def test_groups_of_max_chunks(self):
+        """Test chunks are split into consecutive groups of at most max_chunks"""
+        chunks = [self.chunk(float(i), i + 1.0) for i in range(5)]
+        groups = main.coalesce_audio_chunks(chunks, max_chunks=2)
+        assert [(start, end) for _, start, end in groups] == [(0.0, 2.0), (2.0, 4.0), (4.0, 5.0)]
+
+
+class FakeRequest:
+    """Minimal stand-in exposing the headers etag_matches reads"""
+
+    def __init__(self, headers):
+        self.headers = {name.lower(): value for name, value in headers.items()}
+
+
+class TestSummaryETag:
+    """Test ETag generation and If-None-Match matching for stored summaries"""
+
+    def test_etag_is_quoted_and_stable(self):
+        """Test the same summary/notes pair always yields the same quoted tag"""
+        etag = main.stored_summary_etag("summary", "notes")
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == main.stored_summary_etag("summary", "notes")
+
+    def test_etag_separates_summary_and_notes(self):
+        """Test moving text between summary and notes changes the tag"""
+        assert main.stored_summary_etag("ab", "c") != main.stored_summary_etag("a", "bc")
+
+    def test_missing_header(self):
+        """Test a request without If-None-Match never matches"""
+        assert main.etag_matches(FakeRequest({}), '"abc"') is False
+
+    def test_single_tag(self):
+        """Test a single matching and non-matching tag"""
+        assert main.etag_matches(FakeRequest({"If-None-Match": '"abc"'}), '"abc"') is True
+        assert main.etag_matches(FakeRequest({"If-None-Match": '"xyz"'}), '"abc"') is False
+
+    def test_tag_list(self):
+        """Test a comma-separated list matches when any entry does"""
+        request = FakeRequest({"If-None-Match": '"xyz", "abc" ,"def"'})
+        assert main.etag_matches(request, '"abc"') is True
+        assert main.etag_matches(request, '"nope"') is False
+
+    def test_weak_tag(self):
+        """Test W/ weak tags match under the weak comparison If-None-Match uses"""
+        assert main.etag_matches(FakeRequest({"If-None-Match": 'W/"abc"'}), '"abc"') is True
+        assert main.etag_matches(FakeRequest({"If-None-Match": '"xyz", W/"abc"'}), '"abc"') is True
+
+    def test_wildcard(self):
+        """Test * matches any current representation"""
+        assert main.etag_matches(FakeRequest({"If-None-Match": " * "}), '"abc"') is True
+
+    def test_unquoted_value_does_not_match(self):
+        """Test an unquoted value is not a valid entity-tag and never matches"""
+        assert main.etag_matches(FakeRequest({"If-None-Match": "abc"}), '"abc"') is False
+        assert main.etag_matches(FakeRequest({"If-None-Match": "W/abc"}), '"abc"') is False
+
+    def test_remembered_response_keyed_by_etag(self):
+        """Test stored responses are looked up by ETag and the oldest is evicted when full"""
+        with patch.object(main, "_stored_summary_responses", {}) as responses, \
+             patch.object(main, "STORED_SUMMARY_RESPONSE_MAX_ENTRIES", 2):
+            first, second, third = (main.stored_summary_etag(f"summary {i}", "notes") for i in range(3))
+            main.remember_stored_summary_response(first, {"summary": "summary 0"})
+            main.remember_stored_summary_response(second, {"summary": "summary 1"})
+            assert responses[first] == {"summary": "summary 0"}
+
+            main.remember_stored_summary_response(third, {"summary": "summary 2"})
+            assert list(responses) == [second, third]
+
+
+# Leading bytes of each container sniff_audio_container recognises
+WAV_HEADER = b"RIFF\x24\x00\x00\x00WAVEfmt "
+WEBM_HEADER = b"\x1aE\xdf\xa3\x9fB\x86\x81\x01B\xf7\x81\x01B\xf2\x81"
+OGG_HEADER = b"OggS\x00\x02" + b"\x00" * 10
+FLAC_HEADER = b"fLaC\x00\x00\x00\x22" + b"\x00" * 8
+MP4_HEADER = b"\x00\x00\x00\x20ftypM4A \x00\x00\x00\x00"
+ID3_HEADER = b"ID3\x04\x00\x00" + b"\x00" * 10
+MPEG_FRAME_HEADER = b"\xff\xfb\x90\x64" + b"\x00" * 12
+
+
+class TestAudioContainerSniffing:
+    """Test container detection from file headers and the validation fast path"""
+
+    @pytest.mark.parametrize("header,container", [
+        (WAV_HEADER, "wav"),
+        (WEBM_HEADER, "webm"),
+        (OGG_HEADER, "ogg"),
+        (FLAC_HEADER, "flac"),
+        (MP4_HEADER, "mp4"),
+        (ID3_HEADER, "mpeg"),
+        (MPEG_FRAME_HEADER, "mpeg"),
+    ])
+    def test_sniff_known_headers(self, header, container):
+        """Test each supported magic header is recognised"""
+        assert main.sniff_audio_container(header) == container
+
+    @pytest.mark.parametrize("header", [
+        b"",
+        b"\xff",
+        b"RIFF\x24\x00\x00\x00AVI LIST",
+        b"<!DOCTYPE html>\n",
+    ])
+    def test_sniff_unknown_headers(self, header):
+        """Test short, non-audio and non-WAVE RIFF headers are not recognised"""
+        assert main.sniff_audio_container(header) is None
+
+    @pytest.mark.parametrize("name,header", [
+        ("recording.wav", WAV_HEADER),
+        ("recording.webm", WEBM_HEADER),
+        ("recording.ogg", OGG_HEADER),
+        ("recording.flac", FLAC_HEADER),
+        ("recording.m4a", MP4_HEADER),
+        ("recording.mp3", ID3_HEADER),
+    ])
+    def test_known_header_skips_decode(self, tmp_path, name, header):
+        """Test a recognised header with a matching name is accepted without decoding"""
+        file_path = tmp_path / name
+        file_path.write_bytes(header + b"\x00" * 64)
+
+        with patch.object(main, "AudioSegment") as audio_segment:
+            assert main.validate_and_fix_audio_file(str(file_path)) is True
+            audio_segment.from_file.assert_not_called()
+
+    def test_header_only_file_is_decoded(self, tmp_path):
+        """Test a file no larger than its header still goes through the decoder"""
+        file_path = tmp_path / "recording.webm"
+        file_path.write_bytes(WEBM_HEADER)
+
+        with patch.object(main, "AudioSegment") as audio_segment:
+            audio_segment.from_file.side_effect = Exception("Invalid data found when processing input")
+            assert main.validate_and_fix_audio_file(str(file_path)) is False
+            audio_segment.from_file.assert_called_once_with(str(file_path))
+
+    def test_webm_mislabelled_as_wav_is_converted(self, tmp_path):
+        """Test a WebM recording saved as .wav is decoded as WebM and rewritten as WAV"""
+        file_path = tmp_path / "recording.wav"
+        file_path.write_bytes(WEBM_HEADER + b"\x00" * 64)
+        converted = MagicMock()
+
+        with patch.object(main, "AudioSegment") as audio_segment:
+            audio_segment.from_file.side_effect = [
+                Exception("Invalid data found when processing input"),
+                converted,
+            ]
+            assert main.validate_and_fix_audio_file(str(file_path)) is True
+
+        audio_segment.from_file.assert_called_with(str(file_path) + ".backup", format="webm")
+        converted.set_channels.assert_called_once_with(1)
+        converted.set_channels.return_value.set_frame_rate.return_value.export.assert_called_once_with(
+            str(file_path), format="wav"
+        )
+        assert not os.path.exists(str(file_path) + ".backup")
+
+    def test_failed_webm_conversion_restores_file(self, tmp_path):
+        """Test the original bytes are restored when the WebM conversion fails"""
+        file_path = tmp_path / "recording.wav"
+        original = WEBM_HEADER + b"\x00" * 64
+        file_path.write_bytes(original)
+
+        with patch.object(main, "AudioSegment") as audio_segment:
+            audio_segment.from_file.side_effect = Exception("Invalid data found when processing input")
+            assert main.validate_and_fix_audio_file(str(file_path)) is False
+
+        assert file_path.read_bytes() == original
+        assert not os.path.exists(str(file_path) + ".backup")
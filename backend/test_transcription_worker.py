@@ -0,0 +1,82 @@
+"""
+Unit tests for the WhisperX pool worker in transcription_worker.py
+The models and WhisperX are mocked, so no weights are downloaded
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+
+import transcription_worker
+
+
+class TestWhisperxTranscribeFile:
+    """Test whisperx_transcribe_file with the faster-whisper transcriber"""
+
+    @pytest.fixture
+    def mocked_worker(self):
+        """Patch the models and WhisperX calls the worker makes"""
+        audio = np.zeros(16000 * 3, dtype=np.float32)
+        segments = [
+            SimpleNamespace(start=0.0, end=1.2, text=" Hello there."),
+            SimpleNamespace(start=1.5, end=2.8, text=" General Kenobi."),
+        ]
+        model = MagicMock()
+        # faster-whisper returns a lazy generator of segments and the transcription info
+        model.transcribe.return_value = (iter(segments), MagicMock())
+        align_model, metadata = MagicMock(), {"language": "en"}
+        whisperx = MagicMock()
+        whisperx.load_audio.return_value = audio
+        whisperx.align.return_value = {"segments": [
+            {"start": 0.0, "end": 1.2, "text": " Hello there."},
+            {"start": 1.5, "end": 2.8, "text": " General Kenobi."},
+        ]}
+        whisperx.assign_word_speakers.side_effect = lambda diarize_segments, result: {"segments": [
+            dict(segment, speaker=f"SPEAKER_0{i}") for i, segment in enumerate(result["segments"])
+        ]}
+
+        with patch.object(transcription_worker, "whisperx", whisperx, create=True), \
+             patch.object(transcription_worker, "FASTER_WHISPER_AVAILABLE", True), \
+             patch.object(transcription_worker, "get_transcription_model", return_value=model), \
+             patch.object(transcription_worker, "get_whisperx_align_model", return_value=(align_model, metadata)), \
+             patch.object(transcription_worker, "get_whisperx_diarize_model", return_value=MagicMock()):
+            yield SimpleNamespace(audio=audio, model=model, align_model=align_model, metadata=metadata, whisperx=whisperx)
+
+    def test_segments_converted_for_alignment(self, mocked_worker):
+        """Test faster-whisper segments reach whisperx.align as start/end/text dicts"""
+        transcription_worker.whisperx_transcribe_file("meeting.wav")
+
+        mocked_worker.model.transcribe.assert_called_once()
+        mocked_worker.whisperx.align.assert_called_once_with(
+            [
+                {"start": 0.0, "end": 1.2, "text": " Hello there."},
+                {"start": 1.5, "end": 2.8, "text": " General Kenobi."},
+            ],
+            mocked_worker.align_model,
+            mocked_worker.metadata,
+            mocked_worker.audio,
+            transcription_worker.WHISPERX_DEVICE,
+            return_char_alignments=False
+        )
+
+    def test_returns_text_and_speakers(self, mocked_worker):
+        """Test only the text and speaker of each diarized segment are returned"""
+        result = transcription_worker.whisperx_transcribe_file("meeting.wav")
+
+        assert result == [
+            {"text": " Hello there.", "speaker": "SPEAKER_00"},
+            {"text": " General Kenobi.", "speaker": "SPEAKER_01"},
+        ]
+
+    def test_alignment_failure_keeps_transcription(self, mocked_worker):
+        """Test a failed alignment still returns the unaligned segments"""
+        mocked_worker.whisperx.align.side_effect = RuntimeError("no alignment model")
+        mocked_worker.whisperx.assign_word_speakers.side_effect = RuntimeError("no diarization")
+
+        result = transcription_worker.whisperx_transcribe_file("meeting.wav")
+
+        assert result == [
+            {"text": " Hello there.", "speaker": None},
+            {"text": " General Kenobi.", "speaker": None},
+        ]
@@ -0,0 +1,169 @@
+# WhisperX transcription run inside the upload process pool. Pool workers import this
+# module rather than main, so it must stay free of import-time side effects: no database,
+# logging listeners, app or event loop setup.
+import os
+from typing import List
+
+import torch
+
+try:
+    import whisperx
+    WHISPERX_AVAILABLE = True
+except ImportError:
+    print("⚠️  WhisperX not available - using fallback transcription")
+    WHISPERX_AVAILABLE = False
+
+# WhisperX's own transcription backend; used directly for uploaded files when present
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Torch intra-op threads per process; pinned so each model worker does not
+# spawn one BLAS thread per CPU and oversubscribe the machine
+TORCH_NUM_THREADS = max(1, int(os.getenv("OMP_NUM_THREADS", "1")))
+
+# WhisperX configuration for uploaded files - can be configured via environment variables
+WHISPERX_DEVICE = os.getenv("WHISPERX_DEVICE", "cpu")  # Use "cuda" if GPU is available
+# Batch size of the WhisperX pipeline; faster-whisper decodes one file sequentially per
+# worker and ignores it
+WHISPERX_BATCH_SIZE = int(os.getenv("WHISPERX_BATCH_SIZE", "16"))  # Reduce if low on GPU memory
+# CTranslate2 compute types; int8 roughly doubles CPU throughput over float32
+WHISPERX_COMPUTE_TYPES = ("int8", "int8_float16", "int8_float32", "int8_bfloat16", "float16", "bfloat16", "float32")
+WHISPERX_DEFAULT_COMPUTE_TYPE = "float16" if WHISPERX_DEVICE.startswith("cuda") else "int8"
+WHISPERX_COMPUTE_TYPE = os.getenv("WHISPERX_COMPUTE_TYPE", WHISPERX_DEFAULT_COMPUTE_TYPE)
+if WHISPERX_COMPUTE_TYPE not in WHISPERX_COMPUTE_TYPES:
+    print(f"⚠️  Unsupported WHISPERX_COMPUTE_TYPE {WHISPERX_COMPUTE_TYPE!r}, using {WHISPERX_DEFAULT_COMPUTE_TYPE}")
+    WHISPERX_COMPUTE_TYPE = WHISPERX_DEFAULT_COMPUTE_TYPE
+WHISPERX_MODEL_SIZE = os.getenv("WHISPERX_MODEL_SIZE", "base")  # base, small, medium, large
+
+# This process's models, loaded on first use; each pool worker loads its transcription,
+# alignment and diarization models once and reuses them
+_transcription_model = None
+_whisperx_align_model = None  # (model, metadata)
+_whisperx_diarize_model = None
+
+def patch_torch_load_for_whisperx():
+    """Fix for PyTorch 2.6+ weights loading issue with WhisperX: default torch.load to weights_only=False"""
+    if getattr(torch.load, "whisperx_patched", False):
+        return
+    original_torch_load = torch.load
+    def patched_torch_load(*args, **kwargs):
+        kwargs.setdefault('weights_only', False)
+        return original_torch_load(*args, **kwargs)
+    patched_torch_load.whisperx_patched = True
+    torch.load = patched_torch_load
+
+def get_transcription_model():
+    """
+    Get this process's transcription model, loading it on first use: a faster-whisper
+    (CTranslate2) WhisperModel when installed, otherwise WhisperX's batched pipeline
+    """
+    global _transcription_model
+    if _transcription_model is None:
+        if FASTER_WHISPER_AVAILABLE:
+            # One pool worker per core, so each model gets the worker's thread budget
+            _transcription_model = WhisperModel(
+                WHISPERX_MODEL_SIZE,
+                device=WHISPERX_DEVICE,
+                compute_type=WHISPERX_COMPUTE_TYPE,
+                cpu_threads=TORCH_NUM_THREADS
+            )
+        else:
+            patch_torch_load_for_whisperx()
+            _transcription_model = whisperx.load_model(WHISPERX_MODEL_SIZE, WHISPERX_DEVICE, compute_type=WHISPERX_COMPUTE_TYPE)
+    return _transcription_model
+
+def get_whisperx_align_model():
+    """Get this process's English alignment model and metadata, loading them on first use"""
+    global _whisperx_align_model
+    if _whisperx_align_model is None:
+        patch_torch_load_for_whisperx()
+        _whisperx_align_model = whisperx.load_align_model(language_code="en", device=WHISPERX_DEVICE)
+    return _whisperx_align_model
+
+def get_whisperx_diarize_model():
+    """Get this process's diarization pipeline, loading it on first use"""
+    global _whisperx_diarize_model
+    if _whisperx_diarize_model is None:
+        # Check if HuggingFace token is available for diarization
+        hf_token = os.getenv("HUGGINGFACE_TOKEN") or os.getenv("HF_TOKEN")
+        
+        # Load diarization model - Updated for newer WhisperX versions
+        try:
+            # Try the newer import path first
+            _whisperx_diarize_model = whisperx.diarize.DiarizationPipeline(use_auth_token=hf_token, device=WHISPERX_DEVICE)
+        except AttributeError:
+            # Fallback to older import path
+            _whisperx_diarize_model = whisperx.DiarizationPipeline(use_auth_token=hf_token, device=WHISPERX_DEVICE)
+    return _whisperx_diarize_model
+
+def init_whisperx_worker():
+    """Load the transcription model once when a pool process starts, not once per file"""
+    try:
+        torch.set_num_threads(TORCH_NUM_THREADS)
+        get_transcription_model()
+        print(f"[ProcessUpload] Worker {os.getpid()} loaded transcription model {WHISPERX_MODEL_SIZE}")
+    except Exception as e:
+        # whisperx_transcribe_file retries the load and reports per file
+        print(f"[ProcessUpload] Worker {os.getpid()} failed to preload transcription model: {e}")
+
+def whisperx_transcribe_file(audio_file: str) -> List[dict]:
+    """
+    Transcribe one audio file in a pool worker (with faster-whisper, or WhisperX's
+    pipeline without it), then align and diarize it with WhisperX.
+    Returns the segments' text and speaker labels.
+    """
+    print(f"[ProcessUpload] Processing audio file with WhisperX: {audio_file}")
+    
+    # 1. Load audio
+    audio = whisperx.load_audio(audio_file)
+    print(f"[ProcessUpload] Audio loaded, duration: {len(audio)/16000:.2f} seconds")
+    
+    # 2. Transcribe with English language specified
+    model = get_transcription_model()
+    if FASTER_WHISPER_AVAILABLE:
+        # Greedy decoding with VAD; segments are generated lazily as the audio is decoded
+        segments, _ = model.transcribe(audio, beam_size=1, language="en", vad_filter=True)
+        result = {
+            "segments": [{"start": segment.start, "end": segment.end, "text": segment.text} for segment in segments],
+            "language": "en"
+        }
+    else:
+        result = model.transcribe(audio, batch_size=WHISPERX_BATCH_SIZE, language="en")
+    print(f"[ProcessUpload] Transcription completed, found {len(result.get('segments', []))} segments")
+    
+    # 3. Align whisper output with the English alignment model
+    try:
+        model_a, metadata = get_whisperx_align_model()
+        result = whisperx.align(result["segments"], model_a, metadata, audio, WHISPERX_DEVICE, return_char_alignments=False)
+        print(f"[ProcessUpload] Alignment completed")
+    except Exception as align_error:
+        print(f"[ProcessUpload] Alignment failed: {align_error}")
+        print("[ProcessUpload] Continuing without alignment")
+    
+    # 4. Assign speaker labels with diarization
+    try:
+        # Run diarization
+        diarize_segments = get_whisperx_diarize_model()(audio_file)
+        
+        # Assign speakers to transcription segments
+        result = whisperx.assign_word_speakers(diarize_segments, result)
+        print(f"[ProcessUpload] Speaker diarization completed")
+        
+    except Exception as diarize_error:
+        print(f"[ProcessUpload] Speaker diarization failed: {diarize_error}")
+        if "pyannote" in str(diarize_error).lower():
+            print("[ProcessUpload] Hint: You may need to accept pyannote/speaker-diarization-3.1 user conditions at https://hf.co/pyannote/speaker-diarization-3.1")
+            print("[ProcessUpload] And set HUGGINGFACE_TOKEN environment variable")
+        elif "DiarizationPipeline" in str(diarize_error):
+            print("[ProcessUpload] Hint: WhisperX version compatibility issue. Try updating WhisperX or using a different version.")
+            print("[ProcessUpload] Alternative: pip install git+https://github.com/m-bain/whisperX.git")
+        print("[ProcessUpload] Continuing with transcription only (no speaker labels)")
+    
+    # Only the fields the caller stores cross the process boundary
+    return [
+        {"text": segment.get("text", ""), "speaker": segment.get("speaker")}
+        for segment in result.get("segments", [])
+    ]